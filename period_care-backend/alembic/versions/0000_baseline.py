@@ -0,0 +1,143 @@
+"""Baseline schema: the tables that existed before migrations were introduced
+
+Revision ID: 0000_baseline
+Revises:
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0000_baseline"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+    ]
+
+
+def _tables():
+    """(table name, columns and constraints, extra indexes) in foreign key order"""
+    return [
+        ("users", [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("email", sa.String(length=255), nullable=False),
+            sa.Column("mobile", sa.String(length=15), nullable=False),
+            sa.Column("address", sa.Text(), nullable=True),
+            sa.Column("password", sa.String(length=255), nullable=False),
+            sa.Column("role", sa.String(length=20), nullable=True),
+            sa.Column("last_order_date", sa.DateTime(), nullable=True),
+            sa.Column("reminder_sent", sa.Boolean(), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            *_timestamps(),
+            sa.PrimaryKeyConstraint("id"),
+        ], [("ix_users_email", ["email"], True)]),
+        ("kits", [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("type", sa.String(length=20), nullable=False),
+            sa.Column("base_price", sa.Float(), nullable=False),
+            sa.Column("image_url", sa.String(length=500), nullable=True),
+            sa.Column("included_items", sa.Text(), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("is_available", sa.Boolean(), nullable=True),
+            *_timestamps(),
+            sa.PrimaryKeyConstraint("id"),
+        ], []),
+        ("fruits", [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("price", sa.Float(), nullable=False),
+            sa.Column("benefits", sa.Text(), nullable=True),
+            sa.Column("emoji_icon", sa.String(length=10), nullable=True),
+            sa.Column("is_available", sa.Boolean(), nullable=True),
+            *_timestamps(),
+            sa.PrimaryKeyConstraint("id"),
+        ], []),
+        ("nutrients", [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("price", sa.Float(), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("is_available", sa.Boolean(), nullable=True),
+            *_timestamps(),
+            sa.PrimaryKeyConstraint("id"),
+        ], []),
+        ("orders", [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("kit_id", sa.Integer(), nullable=False),
+            sa.Column("selected_fruits", sa.Text(), nullable=True),
+            sa.Column("selected_nutrients", sa.Text(), nullable=True),
+            sa.Column("scheduled_date", sa.Date(), nullable=False),
+            sa.Column("delivery_address", sa.Text(), nullable=False),
+            sa.Column("total_amount", sa.Float(), nullable=False),
+            sa.Column("status", sa.String(length=20), nullable=True),
+            sa.Column("whatsapp_sent", sa.Boolean(), nullable=True),
+            *_timestamps(),
+            sa.ForeignKeyConstraint(["kit_id"], ["kits.id"]),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        ], []),
+        ("reminders", [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("reminder_type", sa.String(length=50), nullable=True),
+            sa.Column("last_order_date", sa.Date(), nullable=False),
+            sa.Column("reminder_date", sa.DateTime(), nullable=True),
+            sa.Column("status", sa.String(length=20), nullable=True),
+            sa.Column("admin_notified", sa.Boolean(), nullable=True),
+            *_timestamps(),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        ], []),
+        ("benefits", [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("title", sa.String(length=200), nullable=False),
+            sa.Column("description", sa.Text(), nullable=False),
+            sa.Column("icon_emoji", sa.String(length=10), nullable=True),
+            sa.Column("display_order", sa.Integer(), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            *_timestamps(),
+            sa.PrimaryKeyConstraint("id"),
+        ], []),
+        ("testimonials", [
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("rating", sa.Integer(), nullable=False),
+            sa.Column("testimonial_text", sa.Text(), nullable=False),
+            sa.Column("location", sa.String(length=100), nullable=True),
+            sa.Column("is_featured", sa.Boolean(), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            *_timestamps(),
+            sa.PrimaryKeyConstraint("id"),
+        ], []),
+    ]
+
+
+def upgrade() -> None:
+    # Databases set up before migrations existed (or by create_tables() on
+    # app startup) already have some or all of these tables
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    for table_name, columns, indexes in _tables():
+        if table_name in existing:
+            continue
+        op.create_table(table_name, *columns)
+        op.create_index(f"ix_{table_name}_id", table_name, ["id"])
+        for name, index_columns, unique in indexes:
+            op.create_index(name, table_name, index_columns, unique=unique)
+
+
+def downgrade() -> None:
+    for table_name, _, _ in reversed(_tables()):
+        op.drop_table(table_name)
@@ -0,0 +1,113 @@
+"""Add order_items and backfill from selected_fruits/selected_nutrients
+
+Revision ID: 0001_order_items
+Revises: 0000_baseline
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_order_items"
+down_revision: Union[str, None] = "0000_baseline"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _parse_item_ids(raw_ids):
+    if not raw_ids:
+        return []
+    try:
+        item_ids = json.loads(raw_ids)
+    except (TypeError, ValueError):
+        return []
+
+    parsed = []
+    for item_id in item_ids if isinstance(item_ids, list) else []:
+        try:
+            parsed.append(int(item_id))
+        except (TypeError, ValueError):
+            continue
+    return parsed
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    # create_tables() may already have created the table on app startup
+    if "order_items" not in inspector.get_table_names():
+        op.create_table(
+            "order_items",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("order_id", sa.Integer(), nullable=False),
+            sa.Column("item_type", sa.String(length=20), nullable=False),
+            sa.Column("item_id", sa.Integer(), nullable=False),
+            sa.Column("unit_price_snapshot", sa.Float(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.ForeignKeyConstraint(["order_id"], ["orders.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_order_items_id", "order_items", ["id"])
+        op.create_index("ix_order_items_order_id", "order_items", ["order_id"])
+        op.create_index("ix_order_items_item_type_item_id", "order_items", ["item_type", "item_id"])
+
+    # Backfill orders that have no line items yet. Historical prices were never
+    # stored, so the current catalog price is used as the snapshot.
+    fruit_prices = dict(bind.execute(sa.text("SELECT id, price FROM fruits")).fetchall())
+    nutrient_prices = dict(bind.execute(sa.text("SELECT id, price FROM nutrients")).fetchall())
+
+    order_items = sa.table(
+        "order_items",
+        sa.column("order_id", sa.Integer),
+        sa.column("item_type", sa.String),
+        sa.column("item_id", sa.Integer),
+        sa.column("unit_price_snapshot", sa.Float),
+    )
+
+    last_id = 0
+    while True:
+        orders = bind.execute(
+            sa.text(
+                "SELECT o.id, o.selected_fruits, o.selected_nutrients FROM orders o "
+                "WHERE o.id > :last_id "
+                "AND NOT EXISTS (SELECT 1 FROM order_items oi WHERE oi.order_id = o.id) "
+                "ORDER BY o.id LIMIT :batch_size"
+            ),
+            {"last_id": last_id, "batch_size": BATCH_SIZE},
+        ).fetchall()
+        if not orders:
+            break
+
+        rows = []
+        for order_id, selected_fruits, selected_nutrients in orders:
+            for item_type, raw_ids, prices in (
+                ("fruit", selected_fruits, fruit_prices),
+                ("nutrient", selected_nutrients, nutrient_prices),
+            ):
+                for item_id in _parse_item_ids(raw_ids):
+                    if item_id in prices:
+                        rows.append({
+                            "order_id": order_id,
+                            "item_type": item_type,
+                            "item_id": item_id,
+                            "unit_price_snapshot": prices[item_id],
+                        })
+            last_id = order_id
+
+        if rows:
+            op.bulk_insert(order_items, rows)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_order_items_item_type_item_id", table_name="order_items")
+    op.drop_index("ix_order_items_order_id", table_name="order_items")
+    op.drop_index("ix_order_items_id", table_name="order_items")
+    op.drop_table("order_items")
@@ -0,0 +1,46 @@
+"""Add composite indexes for the hot order, user and reminder filters
+
+Revision ID: 0002_hot_path_indexes
+Revises: 0001_order_items
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_hot_path_indexes"
+down_revision: Union[str, None] = "0001_order_items"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_orders_created_at", "orders", ["created_at"]),
+    ("ix_orders_user_id_created_at", "orders", ["user_id", "created_at"]),
+    ("ix_orders_status_created_at", "orders", ["status", "created_at"]),
+    ("ix_users_reminder_due", "users", ["last_order_date", "reminder_sent", "is_active"]),
+    ("ix_reminders_status_created_at", "reminders", ["status", "created_at"]),
+    ("ix_reminders_user_id_created_at", "reminders", ["user_id", "created_at"]),
+    ("ix_reminders_last_order_date", "reminders", ["last_order_date"]),
+]
+
+
+def _existing_indexes(table_name):
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    # create_tables() already creates these on fresh databases
+    for name, table_name, columns in INDEXES:
+        if name not in _existing_indexes(table_name):
+            op.create_index(name, table_name, columns)
+
+
+def downgrade() -> None:
+    for name, table_name, _ in reversed(INDEXES):
+        if name in _existing_indexes(table_name):
+            op.drop_index(name, table_name=table_name)
@@ -0,0 +1,36 @@
+"""Add job_watermarks for scheduler catch-up
+
+Revision ID: 0005_job_watermarks
+Revises: 0004_notification_outbox
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_job_watermarks"
+down_revision: Union[str, None] = "0004_notification_outbox"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create_tables() may already have created the table on app startup
+    if "job_watermarks" in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        "job_watermarks",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("watermark", sa.Date(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("job_watermarks")
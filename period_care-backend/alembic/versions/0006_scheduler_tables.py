@@ -0,0 +1,54 @@
+"""Add job_locks and job_runs for the APScheduler job runner
+
+Revision ID: 0006_scheduler_tables
+Revises: 0005_job_watermarks
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_scheduler_tables"
+down_revision: Union[str, None] = "0005_job_watermarks"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create_tables() may already have created these on app startup
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "job_locks" not in existing:
+        op.create_table(
+            "job_locks",
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("locked_by", sa.String(length=255), nullable=False),
+            sa.Column("locked_until", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("name"),
+        )
+
+    if "job_runs" not in existing:
+        op.create_table(
+            "job_runs",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("job_id", sa.String(length=100), nullable=False),
+            sa.Column("host", sa.String(length=255), nullable=False),
+            sa.Column("started_at", sa.DateTime(), nullable=False),
+            sa.Column("duration_ms", sa.Float(), nullable=False),
+            sa.Column("status", sa.String(length=20), nullable=False),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_job_runs_id", "job_runs", ["id"])
+        op.create_index("ix_job_runs_job_id_started_at", "job_runs", ["job_id", "started_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_runs_job_id_started_at", table_name="job_runs")
+    op.drop_index("ix_job_runs_id", table_name="job_runs")
+    op.drop_table("job_runs")
+    op.drop_table("job_locks")
@@ -0,0 +1,47 @@
+"""Add the daily_order_stats rollup
+
+Revision ID: 0007_daily_order_stats
+Revises: 0006_scheduler_tables
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_daily_order_stats"
+down_revision: Union[str, None] = "0006_scheduler_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create_tables() may already have created the table on app startup; the
+    # rollup itself is backfilled by ensure_daily_order_stats() on first start
+    if "daily_order_stats" in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        "daily_order_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("stat_date", sa.Date(), nullable=False),
+        sa.Column("kit_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("order_count", sa.Integer(), nullable=False),
+        sa.Column("revenue", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(["kit_id"], ["kits.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("stat_date", "kit_id", "status", name="uq_daily_order_stats_key"),
+    )
+    op.create_index("ix_daily_order_stats_id", "daily_order_stats", ["id"])
+    op.create_index("ix_daily_order_stats_stat_date", "daily_order_stats", ["stat_date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_daily_order_stats_stat_date", table_name="daily_order_stats")
+    op.drop_index("ix_daily_order_stats_id", table_name="daily_order_stats")
+    op.drop_table("daily_order_stats")
@@ -1,12 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import date, timedelta
-from app.config.database import get_db
+from app.config.database import get_db, get_pool_stats
 from app.schemas.user import UserResponse
 from app.schemas.order import OrderWithDetails
-from app.crud import user as user_crud, order as order_crud, kit as kit_crud, fruit as fruit_crud, nutrient as nutrient_crud
+from app.crud import user as user_crud, order as order_crud, stats as stats_crud
+from app.crud import notification_outbox as outbox_crud, job_run as job_run_crud
+from app.crud.catalog_cache import catalog_cache
+from app.crud.principal_cache import principal_cache
+from app.services.password_hasher import password_hasher
+from app.services.reminder_service import ReminderService
 from app.api.v1.auth import get_current_admin_user
+from app.api.v1.pagination import get_page_cursor, set_next_cursor
+from app.api.v1.export import check_file_format, export_response
+from app.crud.export import stream_rows
+from app.crud.pagination import Cursor
 from app.models.user import User
 
 router = APIRouter()
@@ -18,87 +27,21 @@ def get_dashboard_statistics(
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Get dashboard statistics (Admin only)"""
-    
-    # Get current date ranges
-    today = date.today()
-    week_ago = today - timedelta(days=7)
-    month_ago = today - timedelta(days=30)
-    
-    # Total users
-    total_users = len(user_crud.get_users(db, 0, 10000))
-    active_users = len([u for u in user_crud.get_users(db, 0, 10000) if u.is_active])
-    
-    # Orders statistics
-    all_orders = order_crud.get_orders(db, 0, 10000)
-    total_orders = len(all_orders)
-    
-    pending_orders = len(order_crud.get_orders_by_status(db, "pending", 0, 1000))
-    completed_orders = len(order_crud.get_orders_by_status(db, "completed", 0, 1000))
-    cancelled_orders = len(order_crud.get_orders_by_status(db, "cancelled", 0, 1000))
-    
-    # Revenue calculation
-    total_revenue = sum(order.total_amount for order in all_orders if order.status == "completed")
-    
-    # Recent orders (last 7 days)
-    recent_orders = [o for o in all_orders if o.created_at.date() >= week_ago]
-    weekly_revenue = sum(order.total_amount for order in recent_orders if order.status == "completed")
-    
-    # Monthly stats
-    monthly_orders = [o for o in all_orders if o.created_at.date() >= month_ago]
-    monthly_revenue = sum(order.total_amount for order in monthly_orders if order.status == "completed")
-    
-    # Product statistics
-    total_kits = len(kit_crud.get_kits(db, 0, 1000, available_only=False))
-    available_kits = len(kit_crud.get_kits(db, 0, 1000, available_only=True))
-    
-    total_fruits = len(fruit_crud.get_fruits(db, 0, 1000, available_only=False))
-    available_fruits = len(fruit_crud.get_fruits(db, 0, 1000, available_only=True))
-    
-    total_nutrients = len(nutrient_crud.get_nutrients(db, 0, 1000, available_only=False))
-    available_nutrients = len(nutrient_crud.get_nutrients(db, 0, 1000, available_only=True))
-    
-    # Users due for reminder
-    reminder_due_date = today - timedelta(days=30)
-    users_due_reminder = len(user_crud.get_users_due_for_reminder(db, reminder_due_date))
-    
-    return {
-        "users": {
-            "total": total_users,
-            "active": active_users,
-            "inactive": total_users - active_users,
-            "due_for_reminder": users_due_reminder
-        },
-        "orders": {
-            "total": total_orders,
-            "pending": pending_orders,
-            "completed": completed_orders,
-            "cancelled": cancelled_orders,
-            "this_week": len(recent_orders),
-            "this_month": len(monthly_orders)
-        },
-        "revenue": {
-            "total": total_revenue,
-            "this_week": weekly_revenue,
-            "this_month": monthly_revenue,
-            "average_order_value": total_revenue / total_orders if total_orders > 0 else 0
-        },
-        "products": {
-            "kits": {"total": total_kits, "available": available_kits},
-            "fruits": {"total": total_fruits, "available": available_fruits},
-            "nutrients": {"total": total_nutrients, "available": available_nutrients}
-        }
-    }
+    return stats_crud.get_dashboard_stats(db, date.today())
 
 
 @router.get("/users", response_model=List[UserResponse])
 def get_all_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Cursor] = Depends(get_page_cursor),
     db: Session = Depends(get_db),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Get all users (Admin only)"""
-    users = user_crud.get_users(db, skip, limit)
+    users = user_crud.get_users(db, skip, limit, after=after)
+    set_next_cursor(response, users, limit)
     return users
 
 
@@ -108,8 +51,7 @@ def get_users_due_reminder(
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Get users who need reminders (Admin only)"""
-    reminder_due_date = date.today() - timedelta(days=30)
-    users = user_crud.get_users_due_for_reminder(db, reminder_due_date)
+    users = ReminderService(db).get_users_due_for_reminder()
     
     user_details = []
     for user in users:
@@ -120,7 +62,7 @@ def get_users_due_reminder(
             "mobile": user.mobile,
             "last_order_date": user.last_order_date,
             "reminder_sent": user.reminder_sent,
-            "days_since_order": (date.today() - user.last_order_date).days if user.last_order_date else None
+            "days_since_order": (date.today() - user.last_order_date.date()).days if user.last_order_date else None
         })
     
     return {
@@ -156,13 +98,12 @@ def get_recent_orders(
 ):
     """Get recent orders (Admin only)"""
     start_date = date.today() - timedelta(days=days)
-    orders = order_crud.get_orders_by_date_range(db, start_date, date.today())
+    orders = order_crud.get_orders_by_date_range(db, start_date, date.today(), limit=limit)
     
-    # Limit and transform results
-    limited_orders = orders[:limit]
+    # Transform results
     order_details = []
     
-    for order in limited_orders:
+    for order in orders:
         order_details.append({
             "id": order.id,
             "user_id": order.user_id,
@@ -186,25 +127,70 @@ def get_recent_orders(
     return order_details
 
 
+@router.get("/orders/export")
+def export_orders(
+    format: str = "csv",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    order_status: Optional[str] = Query(None, alias="status"),
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Download orders with user and kit details as CSV or JSONL, optionally by date range and status (Admin only)"""
+    fmt = check_file_format(format)
+    columns, chunks = order_crud.stream_orders_for_export(db, start_date, end_date, order_status)
+    return export_response(stream_rows(columns, chunks, fmt), fmt, "orders")
+
+
 @router.get("/analytics/top-products")
 def get_top_products(
     db: Session = Depends(get_db),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Get top selling products analytics (Admin only)"""
-    # This is a simplified version - you might want to implement more sophisticated analytics
-    orders = order_crud.get_orders(db, 0, 10000)
-    
-    kit_sales = {}
-    for order in orders:
-        if order.status == "completed":
-            kit_name = order.kit.name
-            kit_sales[kit_name] = kit_sales.get(kit_name, 0) + 1
-    
-    # Sort by sales count
-    top_kits = sorted(kit_sales.items(), key=lambda x: x[1], reverse=True)[:5]
-    
-    return {
-        "top_kits": [{"name": name, "sales": count} for name, count in top_kits],
-        "total_completed_orders": len([o for o in orders if o.status == "completed"])
-    }
+    analytics = stats_crud.get_top_kits(db, limit=5)
+    analytics["top_addons"] = stats_crud.get_top_addons(db, limit=5)
+    return analytics
+
+
+@router.get("/cache/stats")
+def get_cache_statistics(
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Get in-process catalog and auth cache statistics (Admin only)"""
+    return {"catalog": catalog_cache.stats(), "auth": principal_cache.stats()}
+
+
+@router.get("/auth/hashing")
+def get_hashing_statistics(
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Get password hashing pool queue depth and timings (Admin only)"""
+    return password_hasher.stats()
+
+
+@router.get("/db/pool")
+def get_pool_statistics(
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Get database connection pool statistics (Admin only)"""
+    return get_pool_stats()
+
+
+@router.get("/outbox/stats")
+def get_outbox_statistics(
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Get notification outbox counts by status (Admin only)"""
+    return outbox_crud.get_outbox_stats(db)
+
+
+@router.get("/jobs/stats")
+def get_job_statistics(
+    days: int = 30,
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Get scheduled job run counts and durations (Admin only)"""
+    return job_run_crud.get_job_run_stats(db, days)
@@ -0,0 +1,68 @@
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config.database import get_async_db
+from app.config.security import decode_access_token, verify_token
+from app.crud.aio import user as user_crud
+from app.crud.catalog_cache import detached_copy
+from app.crud.principal_cache import principal_cache
+from app.api.v1.auth import security
+from app.models.user import User
+
+# Async versions of the auth dependencies, so the async routers resolve the
+# current user without a threadpool thread or a sync pool connection
+
+
+async def get_user_for_token(db: AsyncSession, token: str):
+    """Resolve a bearer token to its user, served from the principal cache when possible"""
+    user_id = principal_cache.get_token_user_id(token)
+    if user_id is not None:
+        user = principal_cache.get_user(user_id)
+        if user is None:
+            user = detached_copy(await user_crud.get_user_by_id(db, user_id))
+            if user:
+                principal_cache.set_user(user.id, user)
+        return user
+    
+    payload = verify_token(token)
+    email = payload.get("sub") if payload else None
+    if not email:
+        return None
+    
+    user = detached_copy(await user_crud.get_user_by_email(db, email))
+    if user:
+        principal_cache.set_token_user_id(token, user.id, payload.get("exp"))
+        principal_cache.set_user(user.id, user)
+    return user
+
+
+async def get_current_user_dependency(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """Dependency to get current authenticated user"""
+    user = await get_user_for_token(db, credentials.credentials)
+    
+    if not user:
+        # Only decode again on the failure path, to tell a bad token from a deleted user
+        if not decode_access_token(credentials.credentials):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    return user
+
+
+async def get_current_admin_user(current_user: User = Depends(get_current_user_dependency)) -> User:
+    """Dependency to ensure current user is admin"""
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return current_user
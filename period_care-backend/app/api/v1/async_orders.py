@@ -0,0 +1,71 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.config.database import get_async_db
+from app.schemas.order import OrderResponse, OrderWithDetails
+from app.crud.aio import order as order_crud
+from app.api.v1.async_auth import get_current_user_dependency, get_current_admin_user
+from app.api.v1.orders import order_with_details
+from app.api.v1.pagination import get_page_cursor, set_next_cursor
+from app.crud.pagination import Cursor
+from app.models.user import User
+
+# Async versions of the read-heavy order endpoints, mounted ahead of the sync
+# router when ASYNC_DATABASE is enabled. Writes stay on the sync router.
+router = APIRouter()
+
+
+@router.get("/", response_model=List[OrderWithDetails])
+async def get_all_orders(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Cursor] = Depends(get_page_cursor),
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Get all orders (Admin only)"""
+    orders = await order_crud.get_orders(db, skip, limit, after=after)
+    set_next_cursor(response, orders, limit)
+    return [order_with_details(order) for order in orders]
+
+
+@router.get("/{order_id}", response_model=OrderResponse)
+async def get_order_by_id(
+    order_id: int,
+    current_user: User = Depends(get_current_user_dependency),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get specific order by ID"""
+    order = await order_crud.get_order_by_id(db, order_id)
+    
+    if not order:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Order not found"
+        )
+    
+    # Check if user owns the order or is admin
+    if order.user_id != current_user.id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    return order
+
+
+@router.get("/status/{status_name}", response_model=List[OrderResponse])
+async def get_orders_by_status(
+    status_name: str,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Cursor] = Depends(get_page_cursor),
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Get orders by status (Admin only)"""
+    orders = await order_crud.get_orders_by_status(db, status_name, skip, limit, after=after)
+    set_next_cursor(response, orders, limit)
+    return orders
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.config.database import get_async_db
+from app.schemas.order import OrderResponse
+from app.crud.aio import order as order_crud
+from app.api.v1.async_auth import get_current_user_dependency
+from app.api.v1.pagination import get_page_cursor, set_next_cursor
+from app.crud.pagination import Cursor
+from app.models.user import User
+
+# Async versions of the user order-history endpoints (see async_orders.py)
+router = APIRouter()
+
+
+@router.get("/orders", response_model=List[OrderResponse])
+async def get_user_orders(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Cursor] = Depends(get_page_cursor),
+    current_user: User = Depends(get_current_user_dependency),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get current user's orders"""
+    orders = await order_crud.get_user_orders(db, current_user.id, skip, limit, after=after)
+    set_next_cursor(response, orders, limit)
+    return orders
+
+
+@router.get("/order-history", response_model=List[OrderResponse])
+async def get_user_order_history(
+    current_user: User = Depends(get_current_user_dependency),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get current user's order history"""
+    orders = await order_crud.get_user_orders(db, current_user.id, 0, 1000)
+    return orders
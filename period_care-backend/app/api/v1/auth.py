@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.config.database import get_db
@@ -6,17 +6,30 @@ from app.config.security import decode_access_token
 from app.schemas.auth import AuthResponse
 from app.schemas.user import UserCreate, UserLogin, UserProfile
 from app.services.auth_service import AuthService
+from app.services.password_hasher import PasswordHasherBusy
 from app.tasks.notification_tasks import send_welcome_notification
 
 router = APIRouter()
 security = HTTPBearer()
 
 
+def hasher_busy() -> HTTPException:
+    """503 for logins and registrations arriving while the password hasher is saturated"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-in requests, please retry shortly",
+        headers={"Retry-After": "1"}
+    )
+
+
 @router.post("/register", response_model=AuthResponse)
-def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user_data: UserCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     """Register a new user"""
     auth_service = AuthService(db)
-    result = auth_service.register_user(user_data)
+    try:
+        result = await auth_service.register_user_async(user_data)
+    except PasswordHasherBusy:
+        raise hasher_busy()
     
     if not result:
         raise HTTPException(
@@ -25,7 +38,7 @@ def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Send welcome notification (background task)
-    send_welcome_notification({
+    background_tasks.add_task(send_welcome_notification, {
         "email": user_data.email,
         "name": user_data.name
     })
@@ -34,10 +47,13 @@ def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=AuthResponse)
-def login_user(login_data: UserLogin, db: Session = Depends(get_db)):
+async def login_user(login_data: UserLogin, db: Session = Depends(get_db)):
     """Authenticate and login user"""
     auth_service = AuthService(db)
-    result = auth_service.login_user(login_data)
+    try:
+        result = await auth_service.login_user_async(login_data)
+    except PasswordHasherBusy:
+        raise hasher_busy()
     
     if not result:
         raise HTTPException(
@@ -110,17 +126,16 @@ def get_current_user_dependency(
     db: Session = Depends(get_db)
 ):
     """Dependency to get current authenticated user"""
-    email = decode_access_token(credentials.credentials)
-    if not email:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
-        )
-    
     auth_service = AuthService(db)
-    user = auth_service.get_current_user(email)
+    user = auth_service.get_user_for_token(credentials.credentials)
     
     if not user:
+        # Only decode again on the failure path, to tell a bad token from a deleted user
+        if not decode_access_token(credentials.credentials):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token"
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
@@ -0,0 +1,56 @@
+import os
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.config.database import get_db
+from app.config.settings import settings
+from app.crud import catalog_io
+from app.api.v1.auth import get_current_admin_user
+from app.api.v1.export import check_file_format, export_response
+from app.models.user import User
+
+router = APIRouter()
+
+
+def _check_entity(entity: str):
+    if entity not in catalog_io.CATALOG:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown catalog: {entity}"
+        )
+
+
+@router.post("/{entity}/import")
+def import_catalog(
+    entity: str,
+    file: UploadFile = File(...),
+    format: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Bulk insert/update kits, fruits or nutrients from a CSV or JSONL file (Admin only)"""
+    _check_entity(entity)
+    # Default to the file extension: .csv or .jsonl
+    fmt = check_file_format(format or os.path.splitext(file.filename or "")[1].lstrip(".").lower())
+    
+    try:
+        return catalog_io.import_catalog(db, entity, file.file, fmt, settings.catalog_import_batch_size)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/{entity}/export")
+def export_catalog(
+    entity: str,
+    format: str = "jsonl",
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Download all kits, fruits or nutrients as CSV or JSONL (Admin only)"""
+    _check_entity(entity)
+    fmt = check_file_format(format)
+    
+    return export_response(catalog_io.export_catalog(db, entity, fmt), fmt, entity)
@@ -0,0 +1,25 @@
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+from typing import Iterator
+from app.crud.export import FORMATS
+
+MEDIA_TYPES = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
+
+
+def check_file_format(fmt: str) -> str:
+    """Validate a csv/jsonl format name for imports and exports"""
+    if fmt not in FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Format must be one of: {', '.join(FORMATS)}"
+        )
+    return fmt
+
+
+def export_response(content: Iterator[str], fmt: str, filename: str) -> StreamingResponse:
+    """Stream an export as a file download"""
+    return StreamingResponse(
+        content,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+    )
@@ -1,16 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.config.database import get_db
 from app.schemas.order import OrderCreate, OrderResponse, OrderCalculation, OrderWithDetails
 from app.services.order_service import OrderService
 from app.crud import order as order_crud
 from app.api.v1.auth import get_current_user_dependency, get_current_admin_user
+from app.api.v1.pagination import get_page_cursor, set_next_cursor
+from app.crud.pagination import Cursor
 from app.models.user import User
 
 router = APIRouter()
 
 
+def order_with_details(order) -> dict:
+    """Flatten an order with its kit and user for OrderWithDetails"""
+    return {
+        "id": order.id,
+        "user_id": order.user_id,
+        "kit_id": order.kit_id,
+        "kit_name": order.kit.name,
+        "kit_type": order.kit.type,
+        "kit_base_price": order.kit.base_price,
+        "user_name": order.user.name,
+        "user_email": order.user.email,
+        "user_mobile": order.user.mobile,
+        "selected_fruits": order.selected_fruits,
+        "selected_nutrients": order.selected_nutrients,
+        "scheduled_date": order.scheduled_date,
+        "delivery_address": order.delivery_address,
+        "total_amount": order.total_amount,
+        "status": order.status,
+        "whatsapp_sent": order.whatsapp_sent,
+        "created_at": order.created_at
+    }
+
+
 @router.post("/calculate", response_model=OrderCalculation)
 def calculate_order_total(
     order_data: OrderCreate,
@@ -50,38 +75,19 @@ def create_order(
 
 @router.get("/", response_model=List[OrderWithDetails])
 def get_all_orders(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Cursor] = Depends(get_page_cursor),
     db: Session = Depends(get_db),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Get all orders (Admin only)"""
-    orders = order_crud.get_orders(db, skip, limit)
+    orders = order_crud.get_orders(db, skip, limit, after=after)
+    set_next_cursor(response, orders, limit)
     
     # Transform to include details
-    order_details = []
-    for order in orders:
-        order_details.append({
-            "id": order.id,
-            "user_id": order.user_id,
-            "kit_id": order.kit_id,
-            "kit_name": order.kit.name,
-            "kit_type": order.kit.type,
-            "kit_base_price": order.kit.base_price,
-            "user_name": order.user.name,
-            "user_email": order.user.email,
-            "user_mobile": order.user.mobile,
-            "selected_fruits": order.selected_fruits,
-            "selected_nutrients": order.selected_nutrients,
-            "scheduled_date": order.scheduled_date,
-            "delivery_address": order.delivery_address,
-            "total_amount": order.total_amount,
-            "status": order.status,
-            "whatsapp_sent": order.whatsapp_sent,
-            "created_at": order.created_at
-        })
-    
-    return order_details
+    return [order_with_details(order) for order in orders]
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
@@ -153,11 +159,14 @@ def send_whatsapp_notification(
 @router.get("/status/{status_name}", response_model=List[OrderResponse])
 def get_orders_by_status(
     status_name: str,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Cursor] = Depends(get_page_cursor),
     db: Session = Depends(get_db),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Get orders by status (Admin only)"""
-    orders = order_crud.get_orders_by_status(db, status_name, skip, limit)
+    orders = order_crud.get_orders_by_status(db, status_name, skip, limit, after=after)
+    set_next_cursor(response, orders, limit)
     return orders
@@ -0,0 +1,26 @@
+from fastapi import HTTPException, Response, status
+from typing import Optional, List
+from app.crud.pagination import Cursor, decode_cursor, next_cursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+# Dependency to decode an optional keyset cursor
+def get_page_cursor(cursor: Optional[str] = None) -> Optional[Cursor]:
+    """Decode the ?cursor= query parameter; skip/limit offset paging is used when absent"""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def set_next_cursor(response: Response, rows: List, limit: int) -> None:
+    """Expose the cursor for the next page in the X-Next-Cursor header"""
+    cursor = next_cursor(rows, limit)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import date, timedelta
 from app.config.database import get_db
 from app.schemas.reminder import ReminderResponse, ReminderWithUser, ReminderUpdate
 from app.services.reminder_service import ReminderService
-from app.crud import reminder as reminder_crud, user as user_crud
+from app.crud import reminder as reminder_crud, user as user_crud, stats as stats_crud
 from app.api.v1.auth import get_current_admin_user
+from app.api.v1.pagination import get_page_cursor, set_next_cursor
+from app.crud.pagination import Cursor
 from app.models.user import User
 
 router = APIRouter()
@@ -39,6 +42,38 @@ def get_pending_reminders(
     return reminder_details
 
 
+@router.get("/all", response_model=List[ReminderWithUser])
+def get_all_reminders(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Cursor] = Depends(get_page_cursor),
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Get all reminders, newest first (Admin only)"""
+    reminders = reminder_crud.get_reminders(db, skip, limit, after=after)
+    set_next_cursor(response, reminders, limit)
+    
+    # Transform to include user details
+    reminder_details = []
+    for reminder in reminders:
+        reminder_details.append({
+            "id": reminder.id,
+            "user_id": reminder.user_id,
+            "user_name": reminder.user.name,
+            "user_email": reminder.user.email,
+            "user_mobile": reminder.user.mobile,
+            "reminder_type": reminder.reminder_type,
+            "last_order_date": reminder.last_order_date,
+            "reminder_date": reminder.reminder_date,
+            "status": reminder.status,
+            "admin_notified": reminder.admin_notified
+        })
+    
+    return reminder_details
+
+
 @router.post("/send")
 def send_reminders_manually(
     db: Session = Depends(get_db),
@@ -135,21 +170,21 @@ def cleanup_old_reminders(
 
 @router.get("/stats")
 def get_reminder_statistics(
+    days: int = 30,
     db: Session = Depends(get_db),
     current_admin: User = Depends(get_current_admin_user)
 ):
-    """Get reminder statistics (Admin only)"""
-    pending_reminders = reminder_crud.get_reminders_by_status(db, "pending")
-    sent_reminders = reminder_crud.get_reminders_by_status(db, "sent")
-    completed_reminders = reminder_crud.get_reminders_by_status(db, "completed")
-    
-    reminder_service = ReminderService(db)
-    users_due = reminder_service.get_users_due_for_reminder()
+    """Get reminder statistics, with per-day and per-type counts for the last days (Admin only)"""
+    status_counts = stats_crud.get_reminder_status_counts(db)
+    users_due = ReminderService(db).count_users_due_for_reminder()
+    breakdowns = stats_crud.get_reminder_breakdowns(db, date.today() - timedelta(days=days))
     
     return {
-        "pending_reminders": len(pending_reminders),
-        "sent_reminders": len(sent_reminders),
-        "completed_reminders": len(completed_reminders),
-        "users_due_for_reminder": len(users_due),
-        "total_reminders": len(pending_reminders) + len(sent_reminders) + len(completed_reminders)
+        "pending_reminders": status_counts["pending"],
+        "sent_reminders": status_counts["sent"],
+        "completed_reminders": status_counts["completed"],
+        "users_due_for_reminder": users_due,
+        "total_reminders": sum(status_counts.values()),
+        "days": days,
+        **breakdowns
     }
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.config.database import get_db
 from app.schemas.user import UserProfile, UserUpdate
 from app.schemas.order import OrderResponse
 from app.crud import user as user_crud, order as order_crud
 from app.api.v1.auth import get_current_user_dependency
+from app.api.v1.pagination import get_page_cursor, set_next_cursor
+from app.crud.pagination import Cursor
 from app.models.user import User
 
 router = APIRouter()
@@ -37,13 +39,16 @@ def update_user_profile(
 
 @router.get("/orders", response_model=List[OrderResponse])
 def get_user_orders(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[Cursor] = Depends(get_page_cursor),
     current_user: User = Depends(get_current_user_dependency),
     db: Session = Depends(get_db)
 ):
     """Get current user's orders"""
-    orders = order_crud.get_user_orders(db, current_user.id, skip, limit)
+    orders = order_crud.get_user_orders(db, current_user.id, skip, limit, after=after)
+    set_next_cursor(response, orders, limit)
     return orders
 
 
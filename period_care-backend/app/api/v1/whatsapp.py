@@ -126,17 +126,17 @@ def get_whatsapp_integration_guide():
             },
             {
                 "step": 3,
-                "title": "Update WhatsApp Service",
-                "description": "Replace the placeholder implementation in app/services/whatsapp_service.py with actual API calls"
+                "title": "Configure the WhatsApp Client",
+                "description": "Set WHATSAPP_API_URL to the provider's Cloud API messages endpoint; without it messages are only printed"
             },
             {
                 "step": 4,
                 "title": "Add Environment Variables",
                 "variables": [
                     "WHATSAPP_API_URL",
-                    "WHATSAPP_ACCESS_TOKEN",
-                    "WHATSAPP_PHONE_NUMBER_ID",
-                    "WHATSAPP_VERIFY_TOKEN"
+                    "WHATSAPP_API_TOKEN",
+                    "WHATSAPP_MAX_IN_FLIGHT",
+                    "WHATSAPP_PER_NUMBER_INTERVAL_SECONDS"
                 ]
             }
         ],
@@ -1,10 +1,89 @@
-from sqlalchemy import create_engine
+import threading
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .settings import settings
 
+
+def is_memory_sqlite(url: str) -> bool:
+    return url.startswith("sqlite") and (":memory:" in url or url.rstrip("/").endswith(":"))
+
+
+def engine_options(url: str) -> dict:
+    """Pool arguments from settings; in-memory SQLite keeps its single-connection pool"""
+    if is_memory_sqlite(url):
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Per-connection SQLite tuning: WAL lets readers run alongside the writer"""
+    cursor = dbapi_connection.cursor()
+    if settings.sqlite_wal:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+    cursor.close()
+
+
+class PoolMonitor:
+    """Counts checkouts on an engine's pool and remembers the peak in use"""
+
+    def __init__(self, sync_engine):
+        self.pool = sync_engine.pool
+        self.checkouts = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self._lock = threading.Lock()
+        event.listen(sync_engine, "checkout", self._on_checkout)
+        event.listen(sync_engine, "checkin", self._on_checkin)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def stats(self) -> dict:
+        pool = self.pool
+        stats = {
+            "pool_class": type(pool).__name__,
+            "checkouts": self.checkouts,
+            "checked_out": self.checked_out,
+            "peak_checked_out": self.peak_checked_out,
+        }
+        # QueuePool (and its async variant) expose sizing details
+        if hasattr(pool, "overflow"):
+            stats.update({
+                "pool_size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "max_overflow": getattr(pool, "_max_overflow", None),
+                "timeout": pool.timeout(),
+            })
+        return stats
+
+
+def configure_engine(sync_engine) -> PoolMonitor:
+    if sync_engine.dialect.name == "sqlite":
+        event.listen(sync_engine, "connect", set_sqlite_pragmas)
+    return PoolMonitor(sync_engine)
+
+
 # Create SQLAlchemy engine
-engine = create_engine(settings.database_url)
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
+pool_monitor = configure_engine(engine)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -12,6 +91,18 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Create Base class
 Base = declarative_base()
 
+# Async drivers for the sync URLs we support
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+# Created on first use so the async drivers are only needed when async mode is on
+async_engine = None
+AsyncSessionLocal = None
+async_pool_monitor = None
+
 
 # Dependency to get database session
 def get_db():
@@ -22,6 +113,60 @@ def get_db():
         db.close()
 
 
+def get_async_database_url() -> str:
+    """Async URL from settings, or database_url with its driver swapped for an async one"""
+    if settings.async_database_url:
+        return settings.async_database_url
+    
+    scheme, separator, rest = settings.database_url.partition("://")
+    if scheme not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver known for '{scheme}', set ASYNC_DATABASE_URL")
+    return ASYNC_DRIVERS[scheme] + separator + rest
+
+
+def get_async_engine():
+    """Create the async engine and session factory on first use"""
+    global async_engine, AsyncSessionLocal, async_pool_monitor
+    if async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        
+        from sqlalchemy.pool import AsyncAdaptedQueuePool
+        
+        async_url = get_async_database_url()
+        options = engine_options(async_url)
+        if options and async_url.startswith("sqlite"):
+            # aiosqlite defaults to NullPool; pool it like the sync engine
+            options["poolclass"] = AsyncAdaptedQueuePool
+        async_engine = create_async_engine(async_url, **options)
+        async_pool_monitor = configure_engine(async_engine.sync_engine)
+        AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    return async_engine
+
+
+# Dependency to get async database session
+async def get_async_db():
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine():
+    global async_engine, AsyncSessionLocal, async_pool_monitor
+    if async_engine is not None:
+        await async_engine.dispose()
+        async_engine = None
+        AsyncSessionLocal = None
+        async_pool_monitor = None
+
+
+def get_pool_stats() -> dict:
+    """Checkout/overflow statistics for the sync (and, if started, async) pool"""
+    stats = {"sync": pool_monitor.stats()}
+    if async_pool_monitor is not None:
+        stats["async"] = async_pool_monitor.stats()
+    return stats
+
+
 # Create all tables
 def create_tables():
     Base.metadata.create_all(bind=engine)
@@ -14,6 +14,12 @@ class FirebaseConfig:
     def initialize_firebase(self):
         """Initialize Firebase Admin SDK"""
         try:
+            # Local Firestore emulator: no credentials needed
+            if os.getenv('FIRESTORE_EMULATOR_HOST'):
+                print(f"🔥 Using Firestore emulator at {os.getenv('FIRESTORE_EMULATOR_HOST')}")
+                self.db = firestore.Client(project=os.getenv('GOOGLE_CLOUD_PROJECT'))
+                return
+            
             # Check if Firebase is already initialized
             if not firebase_admin._apps:
                 service_account_path = settings.firebase_service_account_path
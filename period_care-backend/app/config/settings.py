@@ -6,6 +6,20 @@ class Settings(BaseSettings):
     # Database Options
     database_type: str = "sqlite"  # "firebase" or "postgresql" or "sqlite"
     database_url: str = "sqlite:///./periodcare.db"  # Fallback for SQL databases
+    async_database: bool = False  # Serve hot read endpoints through an AsyncEngine
+    async_database_url: Optional[str] = None  # Derived from database_url when unset
+    
+    # Connection pool (ignored for in-memory SQLite)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Seconds before a connection is replaced
+    db_pool_pre_ping: bool = True
+    
+    # SQLite tuning
+    sqlite_wal: bool = True
+    sqlite_mmap_size: int = 268435456  # 256 MB
+    sqlite_busy_timeout_ms: int = 5000
     
     # Firebase Configuration
     firebase_service_account_path: str = "./firebase-service-account.json"
@@ -17,20 +31,68 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    bcrypt_rounds: int = 12  # Changing this rehashes each user's password at their next login
+    password_hash_workers: int = 2  # Hashing processes; 0 hashes on the request thread
+    password_hash_max_queue: int = 64  # Hash/verify calls in flight before login/register answer 503
     
     # WhatsApp
     admin_whatsapp_number: str = "+917339625044"
+    whatsapp_api_url: Optional[str] = None  # e.g. https://graph.facebook.com/v18.0/<phone-number-id>/messages
+    whatsapp_api_token: Optional[str] = None
+    whatsapp_max_in_flight: int = 10
+    whatsapp_per_number_interval_seconds: float = 1.0
+    whatsapp_timeout_seconds: float = 10.0
+    whatsapp_max_connections: int = 20
+    whatsapp_alert_users_per_message: int = 20  # Admin reminder alerts are split into messages of this many users
     
     # Frontend
     frontend_url: str = "http://localhost:5173"
     
+    # Catalog cache
+    catalog_cache_ttl_seconds: int = 300
+    catalog_cache_max_entries: int = 1024
+    catalog_import_batch_size: int = 1000  # Rows written per transaction by bulk imports
+    
+    # Authenticated principal cache
+    auth_cache_ttl_seconds: int = 60
+    auth_cache_max_entries: int = 10000
+    
+    # Notification outbox dispatcher
+    outbox_dispatcher_enabled: bool = True
+    outbox_poll_interval_seconds: float = 2.0
+    outbox_batch_size: int = 50
+    outbox_max_attempts: int = 8
+    outbox_backoff_base_seconds: int = 5
+    outbox_backoff_max_seconds: int = 3600
+    outbox_lease_seconds: int = 120  # Claimed rows are retried if not finished by then
+    
     # Reminders
     reminder_check_time: str = "09:00"
+    reminder_chunk_size: int = 1000  # Due users processed per insert/send/update round
+    reminder_admin_alert_max_users: int = 100  # Users listed by name in the admin alert
+    reminder_catch_up: bool = True  # Also remind users from days a missed run skipped
+    reminder_catch_up_max_days: int = 7  # Days of backlog a catch-up run handles per batch
+    reminder_purge_batch_size: int = 1000  # Old reminders deleted per transaction
+    reminder_purge_pause_seconds: float = 0.1  # Pause between purge batches
+    reminder_archive_dir: Optional[str] = None  # Archive purged reminders as .jsonl.gz here
+    
+    # Scheduler
+    scheduler_jobstore_url: Optional[str] = None  # Defaults to database_url
+    scheduler_thread_workers: int = 4
+    scheduler_process_workers: int = 2
+    scheduler_misfire_grace_seconds: int = 3600  # A missed run still fires if this late
+    scheduler_lock_ttl_seconds: int = 10800  # A crashed replica's job lock frees up after this
     
     # Email
     smtp_server: str = "smtp.gmail.com"
     smtp_username: Optional[str] = None
     smtp_password: Optional[str] = None
+    smtp_port: int = 587
+    smtp_use_tls: bool = True
+    smtp_timeout_seconds: int = 30
+    smtp_pool_size: int = 4  # Parallel authenticated sessions for bulk sends
+    smtp_max_messages_per_connection: int = 100
+    smtp_batch_size: int = 500  # Bulk sends report throughput per batch
     
     # Redis
     redis_url: str = "redis://localhost:6379"
@@ -0,0 +1 @@
+# Async CRUD operations (used when ASYNC_DATABASE is enabled)
@@ -0,0 +1,40 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import Optional, List
+from app.models.order import Order
+from app.crud.pagination import Cursor, keyset_page
+
+
+async def get_order_by_id(db: AsyncSession, order_id: int) -> Optional[Order]:
+    result = await db.execute(select(Order).where(Order.id == order_id))
+    return result.scalars().first()
+
+
+async def get_orders(db: AsyncSession, skip: int = 0, limit: int = 100,
+                     after: Optional[Cursor] = None) -> List[Order]:
+    query = select(Order).options(
+        joinedload(Order.user),
+        joinedload(Order.kit)
+    )
+    result = await db.execute(keyset_page(query, Order, after, limit, skip))
+    return result.scalars().all()
+
+
+async def get_user_orders(db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100,
+                          after: Optional[Cursor] = None) -> List[Order]:
+    query = select(Order).where(Order.user_id == user_id).options(
+        joinedload(Order.kit)
+    )
+    result = await db.execute(keyset_page(query, Order, after, limit, skip))
+    return result.scalars().all()
+
+
+async def get_orders_by_status(db: AsyncSession, status: str, skip: int = 0, limit: int = 100,
+                               after: Optional[Cursor] = None) -> List[Order]:
+    query = select(Order).where(Order.status == status).options(
+        joinedload(Order.user),
+        joinedload(Order.kit)
+    )
+    result = await db.execute(keyset_page(query, Order, after, limit, skip))
+    return result.scalars().all()
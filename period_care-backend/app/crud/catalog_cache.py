@@ -0,0 +1,133 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List
+from sqlalchemy import inspect
+from app.config.settings import settings
+
+
+_MISSING = object()
+
+
+def detached_copy(obj):
+    """Copy an ORM row into a transient instance that is safe to share across sessions"""
+    if obj is None:
+        return None
+    mapper = inspect(obj).mapper
+    return mapper.class_(**{attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs})
+
+
+class CatalogCache:
+    """Versioned in-memory cache for catalog reads (kits, fruits, nutrients).
+
+    Every entry is keyed by its namespace's current version, so bumping the
+    version on a write makes all older entries for that namespace unreachable.
+    Entries also expire after a TTL, and the cache evicts least recently used
+    entries once it holds more than ``max_entries``.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_load(self, namespace: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling loader on a miss"""
+        now = time.monotonic()
+        with self._lock:
+            version = self._versions.get(namespace, 0)
+            cache_key = (namespace, version, key)
+            entry = self._entries.get(cache_key, _MISSING)
+            if entry is not _MISSING and entry[0] > now:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader()
+
+        with self._lock:
+            # Drop the value if a write bumped the version while we were loading
+            if self._versions.get(namespace, 0) == version:
+                self._store(cache_key, now, value)
+        return value
+
+    def _store(self, cache_key: tuple, now: float, value: Any) -> None:
+        # Caller must hold the lock
+        self._entries[cache_key] = (now + self.ttl_seconds, value)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_many(self, namespace: str, keys: Iterable[Hashable],
+                 loader: Callable[[List[Hashable]], Dict[Hashable, Any]]) -> Dict[Hashable, Any]:
+        """Return cached values for keys, loading all misses with a single loader call"""
+        now = time.monotonic()
+        found: Dict[Hashable, Any] = {}
+        missing: List[Hashable] = []
+        with self._lock:
+            version = self._versions.get(namespace, 0)
+            for key in dict.fromkeys(keys):
+                cache_key = (namespace, version, key)
+                entry = self._entries.get(cache_key, _MISSING)
+                if entry is not _MISSING and entry[0] > now:
+                    self._entries.move_to_end(cache_key)
+                    self.hits += 1
+                    found[key] = entry[1]
+                else:
+                    self.misses += 1
+                    missing.append(key)
+
+        if not missing:
+            return found
+
+        loaded = loader(missing)
+
+        with self._lock:
+            store = self._versions.get(namespace, 0) == version
+            for key in missing:
+                value = loaded.get(key)
+                found[key] = value
+                if store:
+                    self._store((namespace, version, key), now, value)
+        return found
+
+    def bump(self, namespace: str) -> None:
+        """Invalidate every cached entry for a namespace"""
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+            for cache_key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[cache_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for namespace in self._versions:
+                self._versions[namespace] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "versions": dict(self._versions)
+            }
+
+
+# Global catalog cache instance
+catalog_cache = CatalogCache(
+    max_entries=settings.catalog_cache_max_entries,
+    ttl_seconds=settings.catalog_cache_ttl_seconds
+)
@@ -0,0 +1,153 @@
+import csv
+import io
+import json
+from typing import BinaryIO, Dict, Iterator, List, Tuple
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.crud.catalog_cache import catalog_cache
+from app.crud.export import stream_rows
+from app.models.fruit import Fruit
+from app.models.kit import Kit
+from app.models.nutrient import Nutrient
+from app.schemas.fruit import FruitImport
+from app.schemas.kit import KitImport
+from app.schemas.nutrient import NutrientImport
+
+# Catalog tables that support bulk import/export; the name is also the cache namespace
+CATALOG = {
+    "kits": (Kit, KitImport),
+    "fruits": (Fruit, FruitImport),
+    "nutrients": (Nutrient, NutrientImport),
+}
+
+MAX_REPORTED_ERRORS = 100
+
+
+def catalog_columns(entity: str) -> List[str]:
+    """Columns written by exports and accepted by imports, id first"""
+    _, schema = CATALOG[entity]
+    return ["id"] + [name for name in schema.model_fields if name != "id"]
+
+
+def _read_records(file: BinaryIO, fmt: str) -> Iterator[Tuple[int, object]]:
+    """Yield (line number, record) from an upload; unparsable lines yield the error"""
+    text_file = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        reader = csv.DictReader(text_file)
+        for row in reader:
+            # Empty cells fall back to the schema defaults
+            yield reader.line_num, {key: value for key, value in row.items() if key and value not in ("", None)}
+    else:
+        for line_number, line in enumerate(text_file, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as e:
+                yield line_number, e
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+def _upsert_statement(db: Session, model):
+    """INSERT ... ON CONFLICT (id) DO UPDATE for the session's database"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        stmt = postgresql.insert(model)
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(model)
+    else:
+        raise ValueError(f"Bulk upserts are not supported on {dialect}")
+    
+    updates = {column: stmt.excluded[column] for column in model.__table__.c.keys()
+               if column not in ("id", "created_at", "updated_at")}
+    return stmt.on_conflict_do_update(index_elements=[model.id], set_={**updates, "updated_at": func.now()})
+
+
+def _write_batch(db: Session, model, rows: List[Dict]) -> Tuple[int, int]:
+    """Insert new rows and upsert rows with an id in one transaction; returns (inserted, upserted)"""
+    new_rows = [{key: value for key, value in row.items() if key != "id"} for row in rows if row["id"] is None]
+    existing_rows = [row for row in rows if row["id"] is not None]
+    
+    # executemany: one statement per group, however many rows
+    if new_rows:
+        db.execute(insert(model), new_rows)
+    if existing_rows:
+        db.execute(_upsert_statement(db, model), existing_rows)
+    db.commit()
+    return len(new_rows), len(existing_rows)
+
+
+def import_catalog(db: Session, entity: str, file: BinaryIO, fmt: str, batch_size: int = 1000) -> Dict:
+    """Validate an uploaded CSV/JSONL file row by row and write valid rows in batched transactions.
+    
+    Invalid rows are skipped and reported; valid ones are still imported.
+    """
+    model, schema = CATALOG[entity]
+    results = {"inserted": 0, "upserted": 0, "rejected": 0, "batches": 0, "errors": []}
+    explicit_ids = False
+    batch: List[Dict] = []
+    
+    def flush():
+        nonlocal explicit_ids
+        inserted, upserted = _write_batch(db, model, batch)
+        results["inserted"] += inserted
+        results["upserted"] += upserted
+        results["batches"] += 1
+        explicit_ids = explicit_ids or upserted > 0
+        batch.clear()
+    
+    try:
+        for line_number, record in _read_records(file, fmt):
+            if isinstance(record, Exception):
+                error = f"Invalid JSON: {record}"
+            elif not isinstance(record, dict):
+                error = "Expected an object"
+            else:
+                try:
+                    batch.append(schema.model_validate(record).model_dump())
+                    error = None
+                except ValidationError as e:
+                    error = _validation_message(e)
+            
+            if error:
+                results["rejected"] += 1
+                if len(results["errors"]) < MAX_REPORTED_ERRORS:
+                    results["errors"].append({"line": line_number, "error": error})
+            elif len(batch) >= batch_size:
+                flush()
+        
+        if batch:
+            flush()
+        
+        # Rows imported with explicit ids don't advance the PostgreSQL id sequence
+        if explicit_ids and db.get_bind().dialect.name == "postgresql":
+            table = model.__tablename__
+            db.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT MAX(id) FROM {table}))"
+            ))
+            db.commit()
+    finally:
+        if results["batches"]:
+            catalog_cache.bump(entity)
+    
+    return results
+
+
+def export_catalog(db: Session, entity: str, fmt: str, chunk_size: int = 1000) -> Iterator[str]:
+    """Stream a catalog table as CSV or JSONL text, one chunk of rows at a time"""
+    model, _ = CATALOG[entity]
+    columns = catalog_columns(entity)
+    result = db.execute(
+        select(*(model.__table__.c[column] for column in columns))
+        .order_by(model.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    return stream_rows(columns, result.partitions(), fmt)
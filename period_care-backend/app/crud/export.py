@@ -0,0 +1,35 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Iterable, Iterator, Sequence
+
+FORMATS = ("csv", "jsonl")
+
+
+def _json_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def stream_rows(columns: Sequence[str], chunks: Iterable[Sequence], fmt: str) -> Iterator[str]:
+    """Render chunks of result rows as CSV or JSONL text, one string per chunk"""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for chunk in chunks:
+            writer.writerows(chunk)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        # Header only, for an empty export
+        if buffer.tell():
+            yield buffer.getvalue()
+    else:
+        for chunk in chunks:
+            yield "".join(
+                json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=_json_value) + "\n"
+                for row in chunk
+            )
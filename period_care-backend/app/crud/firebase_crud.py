@@ -1,10 +1,110 @@
 from google.cloud import firestore
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 from datetime import datetime, date
 from app.config.firebase import get_firestore_db
-from app.config.security import get_password_hash, verify_password
+from app.crud.firestore_batch import FirestoreBatchWriter
+from app.services.password_hasher import password_hasher
+import base64
 import json
 
+# Largest page a paginated listing returns, whatever limit is asked for.
+# Filtered listings need the composite indexes in app/crud/firestore_indexes.py.
+MAX_PAGE_SIZE = 100
+
+# Fields projected for list views; detail views read whole documents
+ORDER_LIST_FIELDS = ['user_id', 'kit_id', 'total_amount', 'status', 'scheduled_date', 'whatsapp_sent', 'created_at']
+USER_LIST_FIELDS = ['name', 'email', 'mobile', 'last_order_date']
+
+
+def encode_page_cursor(values: Dict) -> str:
+    """Encode the last document's order-by values as an opaque cursor"""
+    payload = {key: {'t': value.isoformat()} if isinstance(value, datetime) else value for key, value in values.items()}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_page_cursor(cursor: str) -> Dict:
+    """Decode a cursor from encode_page_cursor into start_after() values; raises ValueError if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {
+            key: datetime.fromisoformat(value['t']) if isinstance(value, dict) else value
+            for key, value in payload.items()
+        }
+    except (TypeError, ValueError, KeyError, AttributeError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def fetch_page(query, limit: int, start_after: Optional[Dict], fields: Optional[List[str]] = None,
+               order_by_created: bool = True) -> Tuple[List[Dict], Optional[str]]:
+    """Read one page of a query, newest first (or by document id), with an optional field projection.
+    
+    start_after is a decoded cursor (see decode_page_cursor). Returns the page
+    and the cursor for the next one (None on the last page).
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    direction = firestore.Query.DESCENDING if order_by_created else firestore.Query.ASCENDING
+    if order_by_created:
+        query = query.order_by('created_at', direction=direction)
+    query = query.order_by('__name__', direction=direction)
+    if fields:
+        # The cursor needs created_at even when the view doesn't
+        query = query.select(sorted(set(fields) | ({'created_at'} if order_by_created else set())))
+    if start_after:
+        query = query.start_after(start_after)
+    
+    docs = list(query.limit(limit).stream())
+    items = []
+    for doc in docs:
+        data = doc.to_dict()
+        data['id'] = doc.id
+        items.append(data)
+    
+    next_cursor = None
+    if len(docs) == limit:
+        last = items[-1]
+        values = {'created_at': last.get('created_at')} if order_by_created else {}
+        next_cursor = encode_page_cursor({**values, '__name__': last['id']})
+    return items, next_cursor
+
+
+def get_documents(db, refs: Iterable) -> Dict[Tuple[str, str], Dict]:
+    """Fetch any number of documents, from any collections, in one get_all round trip.
+    
+    Results are keyed by (collection, document id); missing documents are left out.
+    """
+    unique_refs = list({ref.path: ref for ref in refs}.values())
+    if not unique_refs:
+        return {}
+    
+    documents = {}
+    for doc in db.get_all(unique_refs):
+        if doc.exists:
+            data = doc.to_dict()
+            data['id'] = doc.id
+            documents[(doc.reference.parent.id, doc.id)] = data
+    return documents
+
+
+def existing_document_ids(db, refs: Iterable) -> set:
+    """Ids of the given documents that exist, read in one get_all projected to a single field"""
+    unique_refs = list({ref.path: ref for ref in refs}.values())
+    if not unique_refs:
+        return set()
+    return {doc.id for doc in db.get_all(unique_refs, field_paths=['updated_at']) if doc.exists}
+
+
+def parse_item_ids(raw_ids) -> List[str]:
+    """Selected fruit/nutrient ids stored as a list or a JSON string, as document ids"""
+    if isinstance(raw_ids, str):
+        try:
+            raw_ids = json.loads(raw_ids)
+        except json.JSONDecodeError:
+            return []
+    if not isinstance(raw_ids, list):
+        return []
+    return [str(item_id) for item_id in raw_ids if item_id is not None]
+
 
 class FirebaseUserCRUD:
     def __init__(self):
@@ -45,7 +145,7 @@ class FirebaseUserCRUD:
         """Create new user"""
         try:
             # Hash password
-            user_data['password'] = get_password_hash(user_data['password'])
+            user_data['password'] = password_hasher.hash(user_data['password'])
             user_data['created_at'] = datetime.utcnow()
             user_data['updated_at'] = datetime.utcnow()
             user_data['role'] = user_data.get('role', 'user')
@@ -61,40 +161,66 @@ class FirebaseUserCRUD:
             print(f"Error creating user: {e}")
             return None
     
-    def update_user(self, user_id: str, update_data: Dict) -> Optional[Dict]:
-        """Update user"""
+    def update_user(self, user_id: str, update_data: Dict, refresh: bool = True) -> Optional[Dict]:
+        """Update user; with refresh=False, skip re-reading it and return just the changed fields"""
         try:
             update_data['updated_at'] = datetime.utcnow()
             doc_ref = self.db.collection(self.collection).document(user_id)
             doc_ref.update(update_data)
+            if not refresh:
+                return {'id': user_id, **update_data}
             return self.get_user_by_id(user_id)
         except Exception as e:
             print(f"Error updating user: {e}")
             return None
     
+    def mark_users_reminder_sent(self, user_ids: List[str]) -> int:
+        """Set reminder_sent for many users in batched writes.
+        
+        Users that no longer exist are skipped. Returns the number of writes
+        committed, which is a partial count if a later batch fails.
+        """
+        now = datetime.utcnow()
+        writer = FirestoreBatchWriter(self.db)
+        try:
+            refs = [self.db.collection(self.collection).document(user_id) for user_id in user_ids]
+            existing = existing_document_ids(self.db, refs)
+            for ref in refs:
+                if ref.id in existing:
+                    writer.update(ref, {'reminder_sent': True, 'updated_at': now})
+            writer.flush()
+        except Exception as e:
+            print(f"Error marking reminders sent after {writer.writes} writes: {e}")
+        return writer.writes
+    
     def authenticate_user(self, email: str, password: str) -> Optional[Dict]:
         """Authenticate user"""
         user = self.get_user_by_email(email)
-        if user and verify_password(password, user['password']):
-            return user
-        return None
+        if not user:
+            return None
+        
+        valid, new_hash = password_hasher.verify_and_update(password, user['password'])
+        if not valid:
+            return None
+        if new_hash:
+            self.db.collection(self.collection).document(user['id']).update({'password': new_hash})
+            user['password'] = new_hash
+        return user
     
-    def get_users_due_for_reminder(self, target_date: date) -> List[Dict]:
-        """Get users due for reminder"""
+    def get_users_due_for_reminder(self, target_date: date, limit: int = MAX_PAGE_SIZE,
+                                   cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """Get one page of users due for reminder, and the cursor for the next page.
+        
+        Raises ValueError for a malformed cursor rather than returning an empty page.
+        """
+        start_after = decode_page_cursor(cursor) if cursor else None
         try:
             users_ref = self.db.collection(self.collection)
             query = users_ref.where('last_order_date', '==', target_date).where('reminder_sent', '==', False).where('is_active', '==', True)
-            docs = query.stream()
-            
-            users = []
-            for doc in docs:
-                user_data = doc.to_dict()
-                user_data['id'] = doc.id
-                users.append(user_data)
-            return users
+            return fetch_page(query, limit, start_after, USER_LIST_FIELDS, order_by_created=False)
         except Exception as e:
             print(f"Error getting users due for reminder: {e}")
-            return []
+            return [], None
 
 
 class FirebaseKitCRUD:
@@ -156,9 +282,63 @@ class FirebaseOrderCRUD:
         self.db = get_firestore_db()
         self.collection = 'orders'
     
+    def resolve_catalog(self, kit_id: str, selected_fruits, selected_nutrients) -> Dict:
+        """Load the kit and every selected fruit/nutrient with a single get_all"""
+        fruit_ids = parse_item_ids(selected_fruits)
+        nutrient_ids = parse_item_ids(selected_nutrients)
+        
+        refs = [self.db.collection('kits').document(str(kit_id))]
+        refs += [self.db.collection('fruits').document(fruit_id) for fruit_id in fruit_ids]
+        refs += [self.db.collection('nutrients').document(nutrient_id) for nutrient_id in nutrient_ids]
+        documents = get_documents(self.db, refs)
+        
+        return {
+            "kit": documents.get(('kits', str(kit_id))),
+            "fruits": [documents[('fruits', fruit_id)] for fruit_id in fruit_ids if ('fruits', fruit_id) in documents],
+            "nutrients": [documents[('nutrients', nutrient_id)] for nutrient_id in nutrient_ids
+                          if ('nutrients', nutrient_id) in documents]
+        }
+    
+    def calculate_order_total(self, kit_id: str, selected_fruits, selected_nutrients) -> Optional[Dict]:
+        """Price a basket; None if the kit is missing or unavailable"""
+        try:
+            catalog = self.resolve_catalog(kit_id, selected_fruits, selected_nutrients)
+        except Exception as e:
+            print(f"Error pricing order: {e}")
+            return None
+        
+        kit = catalog["kit"]
+        if not kit or not kit.get('is_available', True):
+            return None
+        
+        breakdown = {"kit": {"name": kit.get('name'), "price": kit.get('base_price', 0.0)}}
+        totals = {}
+        for item_type in ("fruits", "nutrients"):
+            available = [item for item in catalog[item_type] if item.get('is_available', True)]
+            breakdown[item_type] = [{"name": item.get('name'), "price": item.get('price', 0.0)} for item in available]
+            totals[item_type] = sum(item["price"] for item in breakdown[item_type])
+        
+        return {
+            "kit_price": breakdown["kit"]["price"],
+            "fruits_total": totals["fruits"],
+            "nutrients_total": totals["nutrients"],
+            "total_amount": breakdown["kit"]["price"] + totals["fruits"] + totals["nutrients"],
+            "breakdown": breakdown
+        }
+    
     def create_order(self, order_data: Dict) -> Optional[Dict]:
-        """Create new order"""
+        """Create new order, pricing it from the catalog unless a total is given"""
         try:
+            if 'total_amount' not in order_data:
+                calculation = self.calculate_order_total(
+                    order_data['kit_id'],
+                    order_data.get('selected_fruits'),
+                    order_data.get('selected_nutrients')
+                )
+                if calculation is None:
+                    return None
+                order_data['total_amount'] = calculation['total_amount']
+            
             order_data['created_at'] = datetime.utcnow()
             order_data['updated_at'] = datetime.utcnow()
             order_data['status'] = 'pending'
@@ -171,39 +351,102 @@ class FirebaseOrderCRUD:
             print(f"Error creating order: {e}")
             return None
     
-    def get_user_orders(self, user_id: str) -> List[Dict]:
-        """Get orders for a user"""
+    def get_user_orders(self, user_id: str, limit: int = 20,
+                        cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """Get one page of a user's orders, newest first, and the cursor for the next page.
+        
+        Raises ValueError for a malformed cursor rather than returning an empty page.
+        """
+        start_after = decode_page_cursor(cursor) if cursor else None
         try:
             orders_ref = self.db.collection(self.collection)
-            query = orders_ref.where('user_id', '==', user_id).order_by('created_at', direction=firestore.Query.DESCENDING)
-            docs = query.stream()
-            
-            orders = []
-            for doc in docs:
-                order_data = doc.to_dict()
-                order_data['id'] = doc.id
-                orders.append(order_data)
-            return orders
+            query = orders_ref.where('user_id', '==', user_id)
+            return fetch_page(query, limit, start_after, ORDER_LIST_FIELDS)
         except Exception as e:
             print(f"Error getting user orders: {e}")
-            return []
+            return [], None
     
-    def get_all_orders(self) -> List[Dict]:
-        """Get all orders"""
+    def update_order_status(self, order_id: str, status: str) -> bool:
+        """Change one order's status"""
+        return self.update_order_statuses({order_id: status}) == 1
+    
+    def update_order_statuses(self, statuses: Dict[str, str]) -> int:
+        """Change the status of many orders ({order_id: status}) in batched writes.
+        
+        Orders that no longer exist are skipped. Returns the number of writes
+        committed, which is a partial count if a later batch fails.
+        """
+        now = datetime.utcnow()
+        writer = FirestoreBatchWriter(self.db)
         try:
-            orders_ref = self.db.collection(self.collection)
-            query = orders_ref.order_by('created_at', direction=firestore.Query.DESCENDING)
-            docs = query.stream()
-            
-            orders = []
-            for doc in docs:
-                order_data = doc.to_dict()
-                order_data['id'] = doc.id
-                orders.append(order_data)
-            return orders
+            refs = {order_id: self.db.collection(self.collection).document(order_id) for order_id in statuses}
+            existing = existing_document_ids(self.db, refs.values())
+            for order_id, status in statuses.items():
+                if order_id in existing:
+                    writer.update(refs[order_id], {'status': status, 'updated_at': now})
+            writer.flush()
+        except Exception as e:
+            print(f"Error updating order statuses after {writer.writes} writes: {e}")
+        return writer.writes
+    
+    def get_orders_with_details(self, orders: List[Dict]) -> List[Dict]:
+        """Add user, kit and item details to orders, fetching every referenced document in one get_all"""
+        refs = []
+        for order in orders:
+            refs.append(self.db.collection('users').document(str(order['user_id'])))
+            refs.append(self.db.collection('kits').document(str(order['kit_id'])))
+            refs += [self.db.collection('fruits').document(item_id) for item_id in parse_item_ids(order.get('selected_fruits'))]
+            refs += [self.db.collection('nutrients').document(item_id)
+                     for item_id in parse_item_ids(order.get('selected_nutrients'))]
+        documents = get_documents(self.db, refs)
+        
+        detailed = []
+        for order in orders:
+            user = documents.get(('users', str(order['user_id'])), {})
+            kit = documents.get(('kits', str(order['kit_id'])), {})
+            detailed.append({
+                **order,
+                "user_name": user.get('name'),
+                "user_email": user.get('email'),
+                "user_mobile": user.get('mobile'),
+                "kit_name": kit.get('name'),
+                "kit_type": kit.get('type'),
+                "kit_base_price": kit.get('base_price'),
+                "fruits": [documents[('fruits', item_id)] for item_id in parse_item_ids(order.get('selected_fruits'))
+                           if ('fruits', item_id) in documents],
+                "nutrients": [documents[('nutrients', item_id)] for item_id in parse_item_ids(order.get('selected_nutrients'))
+                              if ('nutrients', item_id) in documents]
+            })
+        return detailed
+    
+    def get_order_with_details(self, order_id: str) -> Optional[Dict]:
+        """Get an order with its user, kit and selected items"""
+        try:
+            doc = self.db.collection(self.collection).document(order_id).get()
+            if not doc.exists:
+                return None
+            order_data = doc.to_dict()
+            order_data['id'] = doc.id
+            return self.get_orders_with_details([order_data])[0]
+        except Exception as e:
+            print(f"Error getting order details: {e}")
+            return None
+    
+    def get_all_orders(self, limit: int = 20, cursor: Optional[str] = None,
+                       status: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """Get one page of all orders, newest first, optionally by status, and the cursor for the next page.
+        
+        Raises ValueError for a malformed cursor rather than returning an empty page.
+        """
+        start_after = decode_page_cursor(cursor) if cursor else None
+        try:
+            query = self.db.collection(self.collection)
+            if status:
+                query = query.where('status', '==', status)
+            return fetch_page(query, limit, start_after, ORDER_LIST_FIELDS)
         except Exception as e:
             print(f"Error getting all orders: {e}")
-            return []
+            return [], None
 
 
 class FirebaseFruitCRUD:
@@ -0,0 +1,64 @@
+from typing import Dict, Optional
+
+# Firestore rejects a single commit with more writes than this
+MAX_BATCH_WRITES = 500
+
+
+class FirestoreBatchWriter:
+    """Collects Firestore writes and commits them as WriteBatches of at most 500 writes.
+
+    Use it as a context manager; whatever is still queued is committed on exit.
+    Each chunk is atomic on its own, so a failure can leave earlier chunks committed.
+    """
+
+    def __init__(self, db, batch_size: int = MAX_BATCH_WRITES):
+        self.db = db
+        self.batch_size = min(batch_size, MAX_BATCH_WRITES)
+        self._batch = None
+        self._pending = 0
+        self.writes = 0
+        self.commits = 0
+
+    def _queued(self):
+        if self._batch is None:
+            self._batch = self.db.batch()
+        return self._batch
+
+    def _added(self):
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def set(self, ref, data: Dict, merge: bool = False):
+        self._queued().set(ref, data, merge=merge)
+        self._added()
+
+    def update(self, ref, data: Dict):
+        self._queued().update(ref, data)
+        self._added()
+
+    def delete(self, ref):
+        self._queued().delete(ref)
+        self._added()
+
+    def add(self, collection: str, data: Dict, document_id: Optional[str] = None) -> str:
+        """Queue a new document (auto id unless given); returns its id"""
+        ref = self.db.collection(collection).document(document_id) if document_id else self.db.collection(collection).document()
+        self.set(ref, data)
+        return ref.id
+
+    def flush(self):
+        """Commit the queued writes, if any"""
+        if self._batch is not None and self._pending:
+            self._batch.commit()
+            self.writes += self._pending
+            self.commits += 1
+        self._batch = None
+        self._pending = 0
+
+    def __enter__(self) -> "FirestoreBatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
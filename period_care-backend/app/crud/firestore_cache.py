@@ -0,0 +1,125 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+
+def _document_data(doc) -> Dict[str, Any]:
+    data = doc.to_dict() or {}
+    data['id'] = doc.id
+    return data
+
+
+class FirestoreCollectionCache:
+    """In-memory copy of a whole Firestore collection kept fresh by an on_snapshot listener.
+
+    Every snapshot replaces the cached documents, so reads are served from memory
+    and only changed documents are billed. Until the first snapshot arrives, or
+    after the listener has stopped, reads go to Firestore and the listener is
+    restarted.
+    """
+
+    def __init__(self, db, collection: str):
+        self.db = db
+        self.collection = collection
+        self._documents: Optional[Dict[str, Dict[str, Any]]] = None
+        self._watch = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.snapshots = 0
+
+    def start(self):
+        """Start (or restart) the snapshot listener"""
+        with self._lock:
+            if self._watch is not None and self._watch.is_active:
+                return
+            old_watch = self._detach()
+            generation = self._generation
+        # Unsubscribe outside the lock: closing a watch joins its consumer
+        # thread, which may be waiting on the lock in _on_snapshot
+        self._unsubscribe(old_watch)
+        
+        try:
+            watch = self.db.collection(self.collection).on_snapshot(
+                lambda docs, changes, read_time: self._on_snapshot(generation, docs)
+            )
+        except Exception as e:
+            print(f"Error watching {self.collection}: {e}")
+            return
+        
+        with self._lock:
+            if generation == self._generation and self._watch is None:
+                self._watch = watch
+                return
+        # Another start() or stop() ran meanwhile and owns the listener
+        self._unsubscribe(watch)
+
+    def stop(self):
+        """Stop the listener and drop the cached documents"""
+        with self._lock:
+            old_watch = self._detach()
+        self._unsubscribe(old_watch)
+
+    def _detach(self):
+        # Caller must hold the lock. Bumping the generation makes any late
+        # callbacks from the old watch ignored.
+        old_watch = self._watch
+        self._watch = None
+        self._documents = None
+        self._generation += 1
+        return old_watch
+
+    def _unsubscribe(self, watch):
+        if watch is None:
+            return
+        try:
+            watch.unsubscribe()
+        except Exception as e:
+            print(f"Error closing {self.collection} listener: {e}")
+
+    def _on_snapshot(self, generation: int, docs):
+        documents = {doc.id: _document_data(doc) for doc in docs}
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._documents = documents
+            self.snapshots += 1
+
+    def _cached(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        with self._lock:
+            if self._documents is not None and self._watch is not None and self._watch.is_active:
+                self.hits += 1
+                return self._documents
+            self.misses += 1
+            stale = self._watch is not None and not self._watch.is_active
+        if stale:
+            print(f"⚠️ {self.collection} listener stopped, restarting")
+            self.start()
+        return None
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        """All documents in the collection (copies, safe to modify)"""
+        documents = self._cached()
+        if documents is not None:
+            return [dict(data) for data in documents.values()]
+        return [_document_data(doc) for doc in self.db.collection(self.collection).stream()]
+
+    def get(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """One document by id, or None if it does not exist"""
+        documents = self._cached()
+        if documents is not None:
+            data = documents.get(document_id)
+            return dict(data) if data is not None else None
+        doc = self.db.collection(self.collection).document(document_id).get()
+        return _document_data(doc) if doc.exists else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "collection": self.collection,
+                "listening": self._watch is not None and self._watch.is_active,
+                "documents": len(self._documents) if self._documents is not None else None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "snapshots": self.snapshots
+            }
@@ -0,0 +1,29 @@
+from typing import Dict, List, Tuple
+
+# Composite indexes needed by the paginated Firestore listings in firebase_crud.
+# Each entry is (collection, [(field, order), ...]); pages are ordered by
+# created_at and then by document id, both descending, so ties page stably.
+COMPOSITE_INDEXES: List[Tuple[str, List[Tuple[str, str]]]] = [
+    # FirebaseOrderCRUD.get_user_orders
+    ("orders", [("user_id", "ASCENDING"), ("created_at", "DESCENDING"), ("__name__", "DESCENDING")]),
+    # FirebaseOrderCRUD.get_all_orders(status=...)
+    ("orders", [("status", "ASCENDING"), ("created_at", "DESCENDING"), ("__name__", "DESCENDING")]),
+    # FirebaseUserCRUD.get_users_due_for_reminder
+    ("users", [("last_order_date", "ASCENDING"), ("reminder_sent", "ASCENDING"),
+               ("is_active", "ASCENDING"), ("__name__", "ASCENDING")]),
+]
+
+
+def index_definitions() -> Dict:
+    """Composite indexes in the firestore.indexes.json format used by the Firebase CLI"""
+    return {
+        "indexes": [
+            {
+                "collectionGroup": collection,
+                "queryScope": "COLLECTION",
+                "fields": [{"fieldPath": field, "order": order} for field, order in fields]
+            }
+            for collection, fields in COMPOSITE_INDEXES
+        ],
+        "fieldOverrides": []
+    }
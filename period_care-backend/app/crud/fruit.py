@@ -2,29 +2,57 @@ from sqlalchemy.orm import Session
 from typing import Optional, List
 from app.models.fruit import Fruit
 from app.schemas.fruit import FruitCreate, FruitUpdate
+from app.crud.catalog_cache import catalog_cache, detached_copy
 
+CACHE_NAMESPACE = "fruits"
 
-def get_fruit_by_id(db: Session, fruit_id: int) -> Optional[Fruit]:
+
+def _query_fruit_by_id(db: Session, fruit_id: int) -> Optional[Fruit]:
     return db.query(Fruit).filter(Fruit.id == fruit_id).first()
 
 
+def get_fruit_by_id(db: Session, fruit_id: int) -> Optional[Fruit]:
+    """Cached read; returns a detached copy, use the write functions to modify"""
+    return catalog_cache.get_or_load(
+        CACHE_NAMESPACE,
+        ("id", fruit_id),
+        lambda: detached_copy(_query_fruit_by_id(db, fruit_id))
+    )
+
+
+def get_fruits_by_ids(db: Session, fruit_ids: List[int]) -> List[Fruit]:
+    if not fruit_ids:
+        return []
+    
+    def load(keys):
+        rows = db.query(Fruit).filter(Fruit.id.in_([key[1] for key in keys])).all()
+        return {("id", row.id): detached_copy(row) for row in rows}
+    
+    found = catalog_cache.get_many(CACHE_NAMESPACE, [("id", fruit_id) for fruit_id in fruit_ids], load)
+    return [fruit for fruit in found.values() if fruit is not None]
+
+
 def get_fruits(db: Session, skip: int = 0, limit: int = 100, available_only: bool = True) -> List[Fruit]:
-    query = db.query(Fruit)
-    if available_only:
-        query = query.filter(Fruit.is_available == True)
-    return query.offset(skip).limit(limit).all()
+    def load():
+        query = db.query(Fruit)
+        if available_only:
+            query = query.filter(Fruit.is_available == True)
+        return [detached_copy(row) for row in query.offset(skip).limit(limit).all()]
+    
+    return catalog_cache.get_or_load(CACHE_NAMESPACE, ("list", skip, limit, available_only), load)
 
 
 def create_fruit(db: Session, fruit: FruitCreate) -> Fruit:
     db_fruit = Fruit(**fruit.dict())
     db.add(db_fruit)
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     db.refresh(db_fruit)
     return db_fruit
 
 
 def update_fruit(db: Session, fruit_id: int, fruit_update: FruitUpdate) -> Optional[Fruit]:
-    db_fruit = get_fruit_by_id(db, fruit_id)
+    db_fruit = _query_fruit_by_id(db, fruit_id)
     if not db_fruit:
         return None
     
@@ -33,26 +61,29 @@ def update_fruit(db: Session, fruit_id: int, fruit_update: FruitUpdate) -> Optio
         setattr(db_fruit, field, value)
     
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     db.refresh(db_fruit)
     return db_fruit
 
 
 def delete_fruit(db: Session, fruit_id: int) -> bool:
-    db_fruit = get_fruit_by_id(db, fruit_id)
+    db_fruit = _query_fruit_by_id(db, fruit_id)
     if not db_fruit:
         return False
     
     db.delete(db_fruit)
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     return True
 
 
 def toggle_fruit_availability(db: Session, fruit_id: int) -> Optional[Fruit]:
-    db_fruit = get_fruit_by_id(db, fruit_id)
+    db_fruit = _query_fruit_by_id(db, fruit_id)
     if not db_fruit:
         return None
     
     db_fruit.is_available = not db_fruit.is_available
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     db.refresh(db_fruit)
     return db_fruit
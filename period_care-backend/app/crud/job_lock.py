@@ -0,0 +1,44 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime, timedelta
+from typing import Optional
+from app.models.job_lock import JobLock
+
+
+def acquire_job_lock(db: Session, name: str, owner: str, ttl_seconds: int) -> bool:
+    """Take (or extend) the lease on a job; False if another owner holds an unexpired lease"""
+    now = datetime.utcnow()
+    locked_until = now + timedelta(seconds=ttl_seconds)
+    
+    # A single conditional UPDATE is atomic across processes
+    result = db.execute(
+        update(JobLock)
+        .where(
+            JobLock.name == name,
+            or_(JobLock.locked_until < now, JobLock.locked_by == owner)
+        )
+        .values(locked_by=owner, locked_until=locked_until)
+    )
+    if result.rowcount:
+        db.commit()
+        return True
+    
+    # No row yet (or held by someone else): the primary key decides who wins
+    try:
+        db.add(JobLock(name=name, locked_by=owner, locked_until=locked_until))
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+
+
+def release_job_lock(db: Session, name: str, owner: str, hold_until: Optional[datetime] = None) -> None:
+    """End the lease now, or keep it until hold_until so no other owner can take it before then"""
+    db.execute(
+        update(JobLock)
+        .where(JobLock.name == name, JobLock.locked_by == owner)
+        .values(locked_until=hold_until or datetime.utcnow())
+    )
+    db.commit()
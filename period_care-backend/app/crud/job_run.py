@@ -0,0 +1,51 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, func
+from typing import Optional, Dict, List
+from datetime import datetime, timedelta
+from app.models.job_run import JobRun
+
+
+def record_job_run(db: Session, job_id: str, host: str, started_at: datetime, duration_ms: float,
+                   error: Optional[str] = None) -> JobRun:
+    job_run = JobRun(
+        job_id=job_id,
+        host=host,
+        started_at=started_at,
+        duration_ms=duration_ms,
+        status="error" if error else "success",
+        error=error
+    )
+    db.add(job_run)
+    db.commit()
+    return job_run
+
+
+def get_job_run_stats(db: Session, days: int = 30) -> List[Dict]:
+    """Per-job run count, error count and duration stats over the last days, plus the latest run"""
+    since = datetime.utcnow() - timedelta(days=days)
+    rows = db.query(
+        JobRun.job_id,
+        func.count(JobRun.id),
+        func.sum(case((JobRun.status == "error", 1), else_=0)),
+        func.avg(JobRun.duration_ms),
+        func.max(JobRun.duration_ms),
+        func.max(JobRun.started_at)
+    ).filter(JobRun.started_at >= since).group_by(JobRun.job_id).all()
+    
+    stats = []
+    for job_id, runs, errors, avg_ms, max_ms, last_started_at in rows:
+        last_run = db.query(JobRun).filter(
+            and_(JobRun.job_id == job_id, JobRun.started_at == last_started_at)
+        ).first()
+        stats.append({
+            "job_id": job_id,
+            "runs": runs,
+            "errors": int(errors or 0),
+            "avg_duration_ms": round(avg_ms or 0.0, 1),
+            "max_duration_ms": round(max_ms or 0.0, 1),
+            "last_started_at": last_started_at,
+            "last_duration_ms": last_run.duration_ms if last_run else None,
+            "last_status": last_run.status if last_run else None,
+            "last_error": last_run.error if last_run else None
+        })
+    return stats
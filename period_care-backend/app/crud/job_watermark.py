@@ -0,0 +1,20 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import date
+from app.models.job_watermark import JobWatermark
+
+
+def get_watermark(db: Session, name: str) -> Optional[date]:
+    row = db.query(JobWatermark).filter(JobWatermark.name == name).first()
+    return row.watermark if row else None
+
+
+def set_watermark(db: Session, name: str, value: date) -> JobWatermark:
+    row = db.query(JobWatermark).filter(JobWatermark.name == name).first()
+    if row:
+        row.watermark = value
+    else:
+        row = JobWatermark(name=name, watermark=value)
+        db.add(row)
+    db.commit()
+    return row
@@ -2,33 +2,53 @@ from sqlalchemy.orm import Session
 from typing import Optional, List
 from app.models.kit import Kit
 from app.schemas.kit import KitCreate, KitUpdate
+from app.crud.catalog_cache import catalog_cache, detached_copy
 
+CACHE_NAMESPACE = "kits"
 
-def get_kit_by_id(db: Session, kit_id: int) -> Optional[Kit]:
+
+def _query_kit_by_id(db: Session, kit_id: int) -> Optional[Kit]:
     return db.query(Kit).filter(Kit.id == kit_id).first()
 
 
+def get_kit_by_id(db: Session, kit_id: int) -> Optional[Kit]:
+    """Cached read; returns a detached copy, use the write functions to modify"""
+    return catalog_cache.get_or_load(
+        CACHE_NAMESPACE,
+        ("id", kit_id),
+        lambda: detached_copy(_query_kit_by_id(db, kit_id))
+    )
+
+
 def get_kits(db: Session, skip: int = 0, limit: int = 100, available_only: bool = True) -> List[Kit]:
-    query = db.query(Kit)
-    if available_only:
-        query = query.filter(Kit.is_available == True)
-    return query.offset(skip).limit(limit).all()
+    def load():
+        query = db.query(Kit)
+        if available_only:
+            query = query.filter(Kit.is_available == True)
+        return [detached_copy(row) for row in query.offset(skip).limit(limit).all()]
+    
+    return catalog_cache.get_or_load(CACHE_NAMESPACE, ("list", skip, limit, available_only), load)
 
 
 def get_kits_by_type(db: Session, kit_type: str) -> List[Kit]:
-    return db.query(Kit).filter(Kit.type == kit_type, Kit.is_available == True).all()
+    def load():
+        rows = db.query(Kit).filter(Kit.type == kit_type, Kit.is_available == True).all()
+        return [detached_copy(row) for row in rows]
+    
+    return catalog_cache.get_or_load(CACHE_NAMESPACE, ("type", kit_type), load)
 
 
 def create_kit(db: Session, kit: KitCreate) -> Kit:
     db_kit = Kit(**kit.dict())
     db.add(db_kit)
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     db.refresh(db_kit)
     return db_kit
 
 
 def update_kit(db: Session, kit_id: int, kit_update: KitUpdate) -> Optional[Kit]:
-    db_kit = get_kit_by_id(db, kit_id)
+    db_kit = _query_kit_by_id(db, kit_id)
     if not db_kit:
         return None
     
@@ -37,26 +57,29 @@ def update_kit(db: Session, kit_id: int, kit_update: KitUpdate) -> Optional[Kit]
         setattr(db_kit, field, value)
     
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     db.refresh(db_kit)
     return db_kit
 
 
 def delete_kit(db: Session, kit_id: int) -> bool:
-    db_kit = get_kit_by_id(db, kit_id)
+    db_kit = _query_kit_by_id(db, kit_id)
     if not db_kit:
         return False
     
     db.delete(db_kit)
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     return True
 
 
 def toggle_kit_availability(db: Session, kit_id: int) -> Optional[Kit]:
-    db_kit = get_kit_by_id(db, kit_id)
+    db_kit = _query_kit_by_id(db, kit_id)
     if not db_kit:
         return None
     
     db_kit.is_available = not db_kit.is_available
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     db.refresh(db_kit)
     return db_kit
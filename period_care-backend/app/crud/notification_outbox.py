@@ -0,0 +1,102 @@
+import secrets
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, update
+from typing import Optional, List, Dict
+from datetime import datetime, timedelta
+from app.models.notification_outbox import NotificationOutbox
+
+
+def enqueue_notification(db: Session, channel: str, body: str, recipient: Optional[str] = None,
+                         subject: Optional[str] = None, order_id: Optional[int] = None) -> NotificationOutbox:
+    """Add a notification to the outbox without committing, so it joins the caller's transaction"""
+    notification = NotificationOutbox(
+        channel=channel,
+        recipient=recipient,
+        subject=subject,
+        body=body,
+        order_id=order_id,
+        status="pending",
+        attempts=0,
+        next_attempt_at=datetime.utcnow()
+    )
+    db.add(notification)
+    return notification
+
+
+def claim_due_notifications(db: Session, limit: int, lease_seconds: int,
+                            now: Optional[datetime] = None) -> List[NotificationOutbox]:
+    """Lease up to limit due notifications by pushing their next attempt past the lease.
+
+    The lease is taken by a conditional UPDATE that only matches rows still
+    due, so when several dispatchers pick the same candidates each row goes to
+    exactly one of them. If the worker dies before finishing, the lease runs out
+    and another pass picks the rows up again (delivery is at-least-once).
+    """
+    now = now or datetime.utcnow()
+    due = and_(
+        NotificationOutbox.status == "pending",
+        NotificationOutbox.next_attempt_at <= now
+    )
+    candidates = db.query(NotificationOutbox.id).filter(due).order_by(
+        NotificationOutbox.next_attempt_at, NotificationOutbox.id
+    ).limit(limit)
+    if db.bind.dialect.name != "sqlite":
+        candidates = candidates.with_for_update(skip_locked=True)
+    candidate_ids = [notification_id for notification_id, in candidates.all()]
+    if not candidate_ids:
+        db.rollback()
+        return []
+    
+    # Microsecond jitter keeps this claimer's lease value apart from a concurrent one's
+    lease_until = now + timedelta(seconds=lease_seconds, microseconds=secrets.randbelow(1000000))
+    stmt = (
+        update(NotificationOutbox)
+        .where(NotificationOutbox.id.in_(candidate_ids), due)
+        .values(next_attempt_at=lease_until)
+    )
+    if db.bind.dialect.update_returning:
+        claimed_ids = [notification_id for notification_id, in db.execute(stmt.returning(NotificationOutbox.id))]
+    else:
+        db.execute(stmt)
+        claimed_ids = [notification_id for notification_id, in db.query(NotificationOutbox.id).filter(
+            NotificationOutbox.id.in_(candidate_ids),
+            NotificationOutbox.next_attempt_at == lease_until
+        )]
+    db.commit()
+    
+    if not claimed_ids:
+        return []
+    return db.query(NotificationOutbox).filter(NotificationOutbox.id.in_(claimed_ids)).order_by(
+        NotificationOutbox.next_attempt_at, NotificationOutbox.id
+    ).all()
+
+
+def mark_notification_sent(db: Session, notification: NotificationOutbox) -> NotificationOutbox:
+    notification.status = "sent"
+    notification.attempts += 1
+    notification.sent_at = datetime.utcnow()
+    notification.last_error = None
+    db.commit()
+    return notification
+
+
+def mark_notification_failed(db: Session, notification: NotificationOutbox, error: str,
+                             retry_at: Optional[datetime]) -> NotificationOutbox:
+    """Record a failed attempt; with no retry_at the notification is given up on"""
+    notification.attempts += 1
+    notification.last_error = error[:1000]
+    if retry_at is None:
+        notification.status = "failed"
+    else:
+        notification.next_attempt_at = retry_at
+    db.commit()
+    return notification
+
+
+def get_outbox_stats(db: Session) -> Dict[str, int]:
+    counts = dict(
+        db.query(NotificationOutbox.status, func.count(NotificationOutbox.id))
+        .group_by(NotificationOutbox.status)
+        .all()
+    )
+    return {status: counts.get(status, 0) for status in ("pending", "sent", "failed")}
@@ -2,29 +2,57 @@ from sqlalchemy.orm import Session
 from typing import Optional, List
 from app.models.nutrient import Nutrient
 from app.schemas.nutrient import NutrientCreate, NutrientUpdate
+from app.crud.catalog_cache import catalog_cache, detached_copy
 
+CACHE_NAMESPACE = "nutrients"
 
-def get_nutrient_by_id(db: Session, nutrient_id: int) -> Optional[Nutrient]:
+
+def _query_nutrient_by_id(db: Session, nutrient_id: int) -> Optional[Nutrient]:
     return db.query(Nutrient).filter(Nutrient.id == nutrient_id).first()
 
 
+def get_nutrient_by_id(db: Session, nutrient_id: int) -> Optional[Nutrient]:
+    """Cached read; returns a detached copy, use the write functions to modify"""
+    return catalog_cache.get_or_load(
+        CACHE_NAMESPACE,
+        ("id", nutrient_id),
+        lambda: detached_copy(_query_nutrient_by_id(db, nutrient_id))
+    )
+
+
+def get_nutrients_by_ids(db: Session, nutrient_ids: List[int]) -> List[Nutrient]:
+    if not nutrient_ids:
+        return []
+    
+    def load(keys):
+        rows = db.query(Nutrient).filter(Nutrient.id.in_([key[1] for key in keys])).all()
+        return {("id", row.id): detached_copy(row) for row in rows}
+    
+    found = catalog_cache.get_many(CACHE_NAMESPACE, [("id", nutrient_id) for nutrient_id in nutrient_ids], load)
+    return [nutrient for nutrient in found.values() if nutrient is not None]
+
+
 def get_nutrients(db: Session, skip: int = 0, limit: int = 100, available_only: bool = True) -> List[Nutrient]:
-    query = db.query(Nutrient)
-    if available_only:
-        query = query.filter(Nutrient.is_available == True)
-    return query.offset(skip).limit(limit).all()
+    def load():
+        query = db.query(Nutrient)
+        if available_only:
+            query = query.filter(Nutrient.is_available == True)
+        return [detached_copy(row) for row in query.offset(skip).limit(limit).all()]
+    
+    return catalog_cache.get_or_load(CACHE_NAMESPACE, ("list", skip, limit, available_only), load)
 
 
 def create_nutrient(db: Session, nutrient: NutrientCreate) -> Nutrient:
     db_nutrient = Nutrient(**nutrient.dict())
     db.add(db_nutrient)
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     db.refresh(db_nutrient)
     return db_nutrient
 
 
 def update_nutrient(db: Session, nutrient_id: int, nutrient_update: NutrientUpdate) -> Optional[Nutrient]:
-    db_nutrient = get_nutrient_by_id(db, nutrient_id)
+    db_nutrient = _query_nutrient_by_id(db, nutrient_id)
     if not db_nutrient:
         return None
     
@@ -33,26 +61,29 @@ def update_nutrient(db: Session, nutrient_id: int, nutrient_update: NutrientUpda
         setattr(db_nutrient, field, value)
     
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     db.refresh(db_nutrient)
     return db_nutrient
 
 
 def delete_nutrient(db: Session, nutrient_id: int) -> bool:
-    db_nutrient = get_nutrient_by_id(db, nutrient_id)
+    db_nutrient = _query_nutrient_by_id(db, nutrient_id)
     if not db_nutrient:
         return False
     
     db.delete(db_nutrient)
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     return True
 
 
 def toggle_nutrient_availability(db: Session, nutrient_id: int) -> Optional[Nutrient]:
-    db_nutrient = get_nutrient_by_id(db, nutrient_id)
+    db_nutrient = _query_nutrient_by_id(db, nutrient_id)
     if not db_nutrient:
         return None
     
     db_nutrient.is_available = not db_nutrient.is_available
     db.commit()
+    catalog_cache.bump(CACHE_NAMESPACE)
     db.refresh(db_nutrient)
     return db_nutrient
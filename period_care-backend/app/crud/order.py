@@ -1,31 +1,40 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, desc
-from typing import Optional, List
-from datetime import date
+from sqlalchemy import and_, desc, insert, select
+from typing import Optional, List, Dict, Iterator, Sequence, Tuple
+from datetime import date, timedelta
 from app.models.order import Order
+from app.models.order_item import OrderItem
 from app.models.user import User
 from app.models.kit import Kit
 from app.schemas.order import OrderCreate, OrderUpdate
+from app.crud import stats as stats_crud
+from app.crud.pagination import Cursor, keyset_page
 
 
 def get_order_by_id(db: Session, order_id: int) -> Optional[Order]:
     return db.query(Order).filter(Order.id == order_id).first()
 
 
-def get_orders(db: Session, skip: int = 0, limit: int = 100) -> List[Order]:
-    return db.query(Order).options(
+def get_orders(db: Session, skip: int = 0, limit: int = 100, after: Optional[Cursor] = None) -> List[Order]:
+    query = db.query(Order).options(
         joinedload(Order.user),
         joinedload(Order.kit)
-    ).order_by(desc(Order.created_at)).offset(skip).limit(limit).all()
+    )
+    return keyset_page(query, Order, after, limit, skip).all()
 
 
-def get_user_orders(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[Order]:
-    return db.query(Order).filter(Order.user_id == user_id).options(
+def get_user_orders(db: Session, user_id: int, skip: int = 0, limit: int = 100,
+                    after: Optional[Cursor] = None) -> List[Order]:
+    query = db.query(Order).filter(Order.user_id == user_id).options(
         joinedload(Order.kit)
-    ).order_by(desc(Order.created_at)).offset(skip).limit(limit).all()
+    )
+    return keyset_page(query, Order, after, limit, skip).all()
 
 
-def create_order(db: Session, order: OrderCreate, user_id: int, total_amount: float) -> Order:
+def create_order(db: Session, order: OrderCreate, user_id: int, total_amount: float,
+                 items: Optional[List[Dict]] = None, commit: bool = True) -> Order:
+    """Insert an order with its items and rollup update; commit=False leaves the
+    transaction open so the caller can add rows (e.g. outbox) atomically"""
     db_order = Order(
         user_id=user_id,
         kit_id=order.kit_id,
@@ -36,8 +45,26 @@ def create_order(db: Session, order: OrderCreate, user_id: int, total_amount: fl
         total_amount=total_amount
     )
     db.add(db_order)
-    db.commit()
+    db.flush()
     db.refresh(db_order)
+    
+    if items:
+        db.execute(
+            insert(OrderItem),
+            [{**item, "order_id": db_order.id} for item in items]
+        )
+    
+    stats_crud.apply_order_to_rollup(
+        db,
+        db_order.created_at.date(),
+        db_order.kit_id,
+        db_order.status,
+        1,
+        db_order.total_amount
+    )
+    if commit:
+        db.commit()
+        db.refresh(db_order)
     return db_order
 
 
@@ -46,10 +73,12 @@ def update_order(db: Session, order_id: int, order_update: OrderUpdate) -> Optio
     if not db_order:
         return None
     
+    old_status = db_order.status
     update_data = order_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_order, field, value)
     
+    stats_crud.move_order_in_rollup(db, db_order, old_status)
     db.commit()
     db.refresh(db_order)
     return db_order
@@ -60,7 +89,9 @@ def update_order_status(db: Session, order_id: int, status: str) -> Optional[Ord
     if not db_order:
         return None
     
+    old_status = db_order.status
     db_order.status = status
+    stats_crud.move_order_in_rollup(db, db_order, old_status)
     db.commit()
     db.refresh(db_order)
     return db_order
@@ -77,15 +108,17 @@ def mark_whatsapp_sent(db: Session, order_id: int) -> Optional[Order]:
     return db_order
 
 
-def get_orders_by_status(db: Session, status: str, skip: int = 0, limit: int = 100) -> List[Order]:
-    return db.query(Order).filter(Order.status == status).options(
+def get_orders_by_status(db: Session, status: str, skip: int = 0, limit: int = 100,
+                         after: Optional[Cursor] = None) -> List[Order]:
+    query = db.query(Order).filter(Order.status == status).options(
         joinedload(Order.user),
         joinedload(Order.kit)
-    ).order_by(desc(Order.created_at)).offset(skip).limit(limit).all()
+    )
+    return keyset_page(query, Order, after, limit, skip).all()
 
 
-def get_orders_by_date_range(db: Session, start_date: date, end_date: date) -> List[Order]:
-    return db.query(Order).filter(
+def get_orders_by_date_range(db: Session, start_date: date, end_date: date, limit: Optional[int] = None) -> List[Order]:
+    query = db.query(Order).filter(
         and_(
             Order.created_at >= start_date,
             Order.created_at <= end_date
@@ -93,7 +126,41 @@ def get_orders_by_date_range(db: Session, start_date: date, end_date: date) -> L
     ).options(
         joinedload(Order.user),
         joinedload(Order.kit)
-    ).all()
+    ).order_by(desc(Order.created_at))
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
+# Order columns plus the user and kit details an export row carries
+EXPORT_COLUMNS = (
+    Order.id, Order.created_at, Order.status, Order.scheduled_date, Order.total_amount,
+    Order.whatsapp_sent, Order.delivery_address, Order.selected_fruits, Order.selected_nutrients,
+    Order.user_id, User.name.label("user_name"), User.email.label("user_email"),
+    User.mobile.label("user_mobile"), Order.kit_id, Kit.name.label("kit_name"),
+    Kit.type.label("kit_type"), Kit.base_price.label("kit_base_price")
+)
+
+
+def stream_orders_for_export(db: Session, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                             status: Optional[str] = None, chunk_size: int = 1000) -> Tuple[List[str], Iterator[Sequence]]:
+    """Column names and a server-side cursor over matching orders, in chunks of rows.
+    
+    Rows are plain tuples read straight from the cursor, so memory stays flat however many orders match.
+    """
+    query = select(*EXPORT_COLUMNS).join(User, Order.user_id == User.id).join(Kit, Order.kit_id == Kit.id)
+    if start_date:
+        query = query.where(Order.created_at >= start_date)
+    if end_date:
+        query = query.where(Order.created_at < end_date + timedelta(days=1))
+    if status:
+        query = query.where(Order.status == status)
+    
+    result = db.execute(
+        query.order_by(Order.created_at, Order.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    return list(result.keys()), result.partitions()
 
 
 def get_order_with_details(db: Session, order_id: int):
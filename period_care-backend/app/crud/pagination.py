@@ -0,0 +1,63 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple, List, Union
+from sqlalchemy import and_, or_, select, func, literal, desc, asc, DateTime
+from sqlalchemy.orm import Query
+from sqlalchemy.sql import Select
+
+# A decoded cursor: (created_at, id) of the last row on the previous page
+Cursor = Tuple[datetime, int]
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque string"""
+    payload = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Decode a cursor produced by encode_cursor; raises ValueError if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def next_cursor(rows: List, limit: int) -> Optional[str]:
+    """Cursor for the page after rows, or None if this was the last page"""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.id)
+
+
+def keyset_page(query: Union[Query, Select], model, after: Optional[Cursor], limit: int,
+                skip: int = 0, descending: bool = True) -> Union[Query, Select]:
+    """Order by (created_at, id) and page by keyset when a cursor is given, else by offset.
+
+    Works on both a legacy ``Query`` and a 2.0 ``select()`` (used by the async CRUD).
+    """
+    order = desc if descending else asc
+    query = query.order_by(order(model.created_at), order(model.id))
+
+    if after is None:
+        return query.offset(skip).limit(limit)
+
+    created_at, row_id = after
+    # Compare against the anchor row's stored timestamp so the comparison is
+    # exact regardless of how the driver formats datetimes; fall back to the
+    # cursor's own timestamp if the anchor row has since been deleted.
+    anchor = func.coalesce(
+        select(model.created_at).where(model.id == row_id).scalar_subquery(),
+        literal(created_at, DateTime)
+    )
+    # The leading range term lets the database seek into the created_at index
+    # instead of scanning every newer row
+    if descending:
+        condition = and_(model.created_at <= anchor, or_(model.created_at < anchor, model.id < row_id))
+    else:
+        condition = and_(model.created_at >= anchor, or_(model.created_at > anchor, model.id > row_id))
+    return query.filter(condition).limit(limit)
@@ -0,0 +1,93 @@
+import hashlib
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from app.config.settings import settings
+
+
+class PrincipalCache:
+    """Bounded LRU+TTL cache for authenticated request resolution.
+
+    Two maps are kept: a SHA-256 hash of the bearer token -> user id (never
+    outliving the token's own expiry), and user id -> detached User copy.
+    Writes to a user call ``invalidate_user`` so the next request reloads it.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._tokens: "OrderedDict[str, tuple]" = OrderedDict()
+        self._users: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def token_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _get(self, entries: OrderedDict, key) -> Optional[Any]:
+        with self._lock:
+            entry = entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del entries[key]
+            self.misses += 1
+            return None
+
+    def _set(self, entries: OrderedDict, key, value, ttl_seconds: float) -> None:
+        with self._lock:
+            entries[key] = (time.monotonic() + min(ttl_seconds, self.ttl_seconds), value)
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def get_token_user_id(self, token: str) -> Optional[int]:
+        return self._get(self._tokens, self.token_key(token))
+
+    def set_token_user_id(self, token: str, user_id: int, expires_at: Optional[float] = None) -> None:
+        """Remember which user a token belongs to, no longer than the token's exp (epoch seconds)"""
+        ttl = self.ttl_seconds
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl > 0:
+            self._set(self._tokens, self.token_key(token), user_id, ttl)
+
+    def get_user(self, user_id: int):
+        return self._get(self._users, user_id)
+
+    def set_user(self, user_id: int, user) -> None:
+        self._set(self._users, user_id, user, self.ttl_seconds)
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+            self._users.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "tokens": len(self._tokens),
+                "users": len(self._users),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds
+            }
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache(
+    max_entries=settings.auth_cache_max_entries,
+    ttl_seconds=settings.auth_cache_ttl_seconds
+)
@@ -1,19 +1,24 @@
+import gzip
+import json
+import time
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, desc
-from typing import Optional, List
+from sqlalchemy import and_, delete, desc, insert, select, update
+from typing import Optional, List, Dict
 from datetime import date, datetime
 from app.models.reminder import Reminder
 from app.schemas.reminder import ReminderCreate, ReminderUpdate
+from app.crud.pagination import Cursor, keyset_page
 
 
 def get_reminder_by_id(db: Session, reminder_id: int) -> Optional[Reminder]:
     return db.query(Reminder).filter(Reminder.id == reminder_id).first()
 
 
-def get_reminders(db: Session, skip: int = 0, limit: int = 100) -> List[Reminder]:
-    return db.query(Reminder).options(
+def get_reminders(db: Session, skip: int = 0, limit: int = 100, after: Optional[Cursor] = None) -> List[Reminder]:
+    query = db.query(Reminder).options(
         joinedload(Reminder.user)
-    ).order_by(desc(Reminder.created_at)).offset(skip).limit(limit).all()
+    )
+    return keyset_page(query, Reminder, after, limit, skip).all()
 
 
 def get_pending_reminders(db: Session) -> List[Reminder]:
@@ -36,6 +41,20 @@ def create_reminder(db: Session, reminder: ReminderCreate) -> Reminder:
     return db_reminder
 
 
+def create_reminders(db: Session, reminders: List[Dict]) -> Dict[int, int]:
+    """Bulk-insert reminder rows; returns {user_id: reminder_id}"""
+    if not reminders:
+        return {}
+    
+    result = db.execute(
+        insert(Reminder).returning(Reminder.user_id, Reminder.id),
+        reminders
+    )
+    created = {user_id: reminder_id for user_id, reminder_id in result}
+    db.commit()
+    return created
+
+
 def update_reminder(db: Session, reminder_id: int, reminder_update: ReminderUpdate) -> Optional[Reminder]:
     db_reminder = get_reminder_by_id(db, reminder_id)
     if not db_reminder:
@@ -62,6 +81,21 @@ def mark_reminder_sent(db: Session, reminder_id: int) -> Optional[Reminder]:
     return db_reminder
 
 
+def mark_reminders_sent(db: Session, reminder_ids: List[int]) -> int:
+    """Mark many reminders sent with a single UPDATE"""
+    if not reminder_ids:
+        return 0
+    
+    result = db.execute(
+        update(Reminder)
+        .where(Reminder.id.in_(reminder_ids))
+        .values(status="sent", reminder_date=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
 def mark_reminder_completed(db: Session, reminder_id: int) -> Optional[Reminder]:
     db_reminder = get_reminder_by_id(db, reminder_id)
     if not db_reminder:
@@ -96,21 +130,59 @@ def get_reminders_for_date(db: Session, target_date: date) -> List[Reminder]:
     ).options(joinedload(Reminder.user)).all()
 
 
-def delete_old_reminders(db: Session, before_date: datetime) -> int:
-    """Delete completed reminders older than specified date"""
-    count = db.query(Reminder).filter(
-        and_(
-            Reminder.status == "completed",
-            Reminder.created_at < before_date
-        )
-    ).count()
+def _purgeable(before_date: datetime):
+    return and_(Reminder.status == "completed", Reminder.created_at < before_date)
+
+
+def _reminder_row_json(row) -> str:
+    return json.dumps(
+        dict(row),
+        default=lambda value: value.isoformat() if isinstance(value, (date, datetime)) else str(value)
+    )
+
+
+def delete_old_reminders(db: Session, before_date: datetime, batch_size: int = 1000,
+                         pause_seconds: float = 0.0, archive_path: Optional[str] = None) -> int:
+    """Delete completed reminders older than specified date.
     
-    db.query(Reminder).filter(
-        and_(
-            Reminder.status == "completed",
-            Reminder.created_at < before_date
-        )
-    ).delete()
+    Rows go in id ranges of at most batch_size, one short transaction each, with
+    an optional pause in between so other writers are not locked out. With an
+    archive_path, each batch is appended to that gzipped JSONL file first.
+    """
+    archive = gzip.open(archive_path, "at", encoding="utf-8") if archive_path else None
+    deleted = 0
+    last_id = 0
+    try:
+        while True:
+            columns = Reminder.__table__.c if archive else [Reminder.id]
+            rows = db.execute(
+                select(*columns)
+                .where(_purgeable(before_date), Reminder.id > last_id)
+                .order_by(Reminder.id)
+                .limit(batch_size)
+            ).mappings().all()
+            if not rows:
+                break
+            
+            first_id, last_id = rows[0]["id"], rows[-1]["id"]
+            if archive:
+                archive.writelines(_reminder_row_json(row) + "\n" for row in rows)
+                archive.flush()
+            
+            result = db.execute(
+                delete(Reminder)
+                .where(_purgeable(before_date), Reminder.id.between(first_id, last_id))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            deleted += result.rowcount
+            
+            if len(rows) < batch_size:
+                break
+            if pause_seconds:
+                time.sleep(pause_seconds)
+    finally:
+        if archive:
+            archive.close()
     
-    db.commit()
-    return count
+    return deleted
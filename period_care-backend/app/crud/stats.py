@@ -0,0 +1,265 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case, and_, desc, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import Dict, List
+from datetime import date, timedelta
+from app.models.user import User
+from app.models.order import Order
+from app.models.kit import Kit
+from app.models.fruit import Fruit
+from app.models.nutrient import Nutrient
+from app.models.order_item import OrderItem
+from app.models.daily_order_stats import DailyOrderStats
+from app.models.reminder import Reminder
+from app.crud import user as user_crud
+
+
+def apply_order_to_rollup(db: Session, stat_date: date, kit_id: int, status: str,
+                          count_delta: int, revenue_delta: float) -> None:
+    """Add an order's contribution to the daily rollup (caller commits)"""
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        # One atomic upsert, so concurrent first orders for a bucket can't both insert it
+        stmt = (postgresql if dialect == "postgresql" else sqlite).insert(DailyOrderStats).values(
+            stat_date=stat_date,
+            kit_id=kit_id,
+            status=status,
+            order_count=count_delta,
+            revenue=revenue_delta
+        )
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[DailyOrderStats.stat_date, DailyOrderStats.kit_id, DailyOrderStats.status],
+            set_={
+                "order_count": DailyOrderStats.order_count + stmt.excluded.order_count,
+                "revenue": DailyOrderStats.revenue + stmt.excluded.revenue,
+                "updated_at": func.now()
+            }
+        ))
+        return
+
+    row = db.query(DailyOrderStats).filter(
+        and_(
+            DailyOrderStats.stat_date == stat_date,
+            DailyOrderStats.kit_id == kit_id,
+            DailyOrderStats.status == status
+        )
+    ).with_for_update().first()
+
+    if row:
+        row.order_count = DailyOrderStats.order_count + count_delta
+        row.revenue = DailyOrderStats.revenue + revenue_delta
+    else:
+        db.add(DailyOrderStats(
+            stat_date=stat_date,
+            kit_id=kit_id,
+            status=status,
+            order_count=count_delta,
+            revenue=revenue_delta
+        ))
+    db.flush()
+
+
+def move_order_in_rollup(db: Session, order: Order, old_status: str) -> None:
+    """Move an order from its old status bucket to its current one (caller commits)"""
+    if not order.status or old_status == order.status:
+        return
+
+    stat_date = order.created_at.date()
+    apply_order_to_rollup(db, stat_date, order.kit_id, old_status, -1, -order.total_amount)
+    apply_order_to_rollup(db, stat_date, order.kit_id, order.status, 1, order.total_amount)
+
+
+def rebuild_daily_order_stats(db: Session) -> int:
+    """Recompute the whole daily rollup from the orders table"""
+    stat_date = func.date(Order.created_at)
+    source = db.query(
+        stat_date,
+        Order.kit_id,
+        Order.status,
+        func.count(Order.id),
+        func.sum(Order.total_amount)
+    ).group_by(stat_date, Order.kit_id, Order.status)
+
+    db.query(DailyOrderStats).delete(synchronize_session=False)
+    db.execute(
+        insert(DailyOrderStats).from_select(
+            ["stat_date", "kit_id", "status", "order_count", "revenue"],
+            source.statement
+        )
+    )
+    db.commit()
+    return db.query(func.count(DailyOrderStats.id)).scalar()
+
+
+def ensure_daily_order_stats(db: Session) -> None:
+    """Backfill the rollup if it is empty but orders already exist"""
+    if db.query(DailyOrderStats.id).first() is None and db.query(Order.id).first() is not None:
+        rebuild_daily_order_stats(db)
+
+
+def get_user_stats(db: Session, reminder_due_date: date) -> Dict[str, int]:
+    """Count total, active and reminder-due users in a single query"""
+    total, active, due = db.query(
+        func.count(User.id),
+        func.coalesce(func.sum(case((User.is_active == True, 1), else_=0)), 0),
+        func.coalesce(func.sum(case(
+            (user_crud._due_for_reminder(reminder_due_date), 1),
+            else_=0
+        )), 0)
+    ).one()
+
+    return {
+        "total": total,
+        "active": active,
+        "inactive": total - active,
+        "due_for_reminder": due
+    }
+
+
+def get_order_stats(db: Session, today: date) -> Dict[str, dict]:
+    """Aggregate order counts and revenue per status from the daily rollup"""
+    in_week = DailyOrderStats.stat_date >= today - timedelta(days=7)
+    in_month = DailyOrderStats.stat_date >= today - timedelta(days=30)
+
+    rows = db.query(
+        DailyOrderStats.status,
+        func.coalesce(func.sum(DailyOrderStats.order_count), 0),
+        func.coalesce(func.sum(DailyOrderStats.revenue), 0.0),
+        func.coalesce(func.sum(case((in_week, DailyOrderStats.order_count), else_=0)), 0),
+        func.coalesce(func.sum(case((in_week, DailyOrderStats.revenue), else_=0.0)), 0.0),
+        func.coalesce(func.sum(case((in_month, DailyOrderStats.order_count), else_=0)), 0),
+        func.coalesce(func.sum(case((in_month, DailyOrderStats.revenue), else_=0.0)), 0.0)
+    ).group_by(DailyOrderStats.status).all()
+
+    orders = {"total": 0, "pending": 0, "completed": 0, "cancelled": 0, "this_week": 0, "this_month": 0}
+    revenue = {"total": 0.0, "this_week": 0.0, "this_month": 0.0}
+
+    for order_status, count, amount, week_count, week_amount, month_count, month_amount in rows:
+        orders["total"] += count
+        orders["this_week"] += week_count
+        orders["this_month"] += month_count
+        if order_status in ("pending", "completed", "cancelled"):
+            orders[order_status] = count
+
+        # Only completed orders count towards revenue
+        if order_status == "completed":
+            revenue["total"] = amount
+            revenue["this_week"] = week_amount
+            revenue["this_month"] = month_amount
+
+    revenue["average_order_value"] = revenue["total"] / orders["total"] if orders["total"] > 0 else 0
+
+    return {"orders": orders, "revenue": revenue}
+
+
+def get_top_kits(db: Session, limit: int = 5) -> Dict[str, object]:
+    """Rank kits by completed order count from the daily rollup"""
+    sales = func.sum(DailyOrderStats.order_count)
+    top_kits = db.query(Kit.name, sales).select_from(DailyOrderStats).join(
+        Kit, Kit.id == DailyOrderStats.kit_id
+    ).filter(
+        DailyOrderStats.status == "completed"
+    ).group_by(Kit.id, Kit.name).having(sales > 0).order_by(desc(sales)).limit(limit).all()
+
+    total_completed = db.query(
+        func.coalesce(func.sum(DailyOrderStats.order_count), 0)
+    ).filter(DailyOrderStats.status == "completed").scalar()
+
+    return {
+        "top_kits": [{"name": name, "sales": count} for name, count in top_kits],
+        "total_completed_orders": total_completed
+    }
+
+
+def get_top_addons(db: Session, limit: int = 5) -> list:
+    """Rank fruits and nutrients by completed order count and revenue"""
+    times_ordered = func.count(OrderItem.id)
+    revenue = func.sum(OrderItem.unit_price_snapshot)
+    rows = db.query(
+        OrderItem.item_type,
+        OrderItem.item_id,
+        func.coalesce(Fruit.name, Nutrient.name),
+        times_ordered,
+        revenue
+    ).select_from(OrderItem).join(
+        Order, Order.id == OrderItem.order_id
+    ).outerjoin(
+        Fruit, and_(OrderItem.item_type == "fruit", Fruit.id == OrderItem.item_id)
+    ).outerjoin(
+        Nutrient, and_(OrderItem.item_type == "nutrient", Nutrient.id == OrderItem.item_id)
+    ).filter(
+        Order.status == "completed"
+    ).group_by(
+        OrderItem.item_type, OrderItem.item_id, Fruit.name, Nutrient.name
+    ).order_by(desc(times_ordered)).limit(limit).all()
+
+    return [
+        {"type": item_type, "id": item_id, "name": name, "sales": count, "revenue": amount}
+        for item_type, item_id, name, count, amount in rows
+    ]
+
+
+def _availability_counts(db: Session, model) -> Dict[str, int]:
+    total, available = db.query(
+        func.count(model.id),
+        func.coalesce(func.sum(case((model.is_available == True, 1), else_=0)), 0)
+    ).one()
+    return {"total": total, "available": available}
+
+
+def get_product_stats(db: Session) -> Dict[str, dict]:
+    """Count total and available kits, fruits and nutrients"""
+    return {
+        "kits": _availability_counts(db, Kit),
+        "fruits": _availability_counts(db, Fruit),
+        "nutrients": _availability_counts(db, Nutrient)
+    }
+
+
+REMINDER_STATUSES = ("pending", "sent", "completed")
+
+
+def _reminder_status_columns():
+    return [
+        func.count(Reminder.id),
+        *(func.coalesce(func.sum(case((Reminder.status == status, 1), else_=0)), 0)
+          for status in REMINDER_STATUSES)
+    ]
+
+
+def _reminder_status_row(total, *counts) -> Dict[str, int]:
+    return {"total": total, **dict(zip(REMINDER_STATUSES, counts))}
+
+
+def get_reminder_status_counts(db: Session) -> Dict[str, int]:
+    """Count reminders per status with a single GROUP BY"""
+    counts = dict(db.query(Reminder.status, func.count(Reminder.id)).group_by(Reminder.status).all())
+    return {status: counts.get(status, 0) for status in REMINDER_STATUSES}
+
+
+def get_reminder_breakdowns(db: Session, since: date) -> Dict[str, List[dict]]:
+    """Per-day and per-reminder_type status counts for reminders created since a date"""
+    created_day = func.date(Reminder.created_at)
+    window = Reminder.created_at >= since
+    
+    by_day = db.query(created_day, *_reminder_status_columns()).filter(window) \
+        .group_by(created_day).order_by(created_day).all()
+    by_type = db.query(Reminder.reminder_type, *_reminder_status_columns()).filter(window) \
+        .group_by(Reminder.reminder_type).order_by(Reminder.reminder_type).all()
+    
+    return {
+        "by_day": [{"date": str(day), **_reminder_status_row(*counts)} for day, *counts in by_day],
+        "by_type": [{"reminder_type": reminder_type, **_reminder_status_row(*counts)}
+                    for reminder_type, *counts in by_type]
+    }
+
+
+def get_dashboard_stats(db: Session, today: date) -> Dict[str, dict]:
+    """Collect all admin dashboard statistics"""
+    order_stats = get_order_stats(db, today)
+    return {
+        "users": get_user_stats(db, today - timedelta(days=30)),
+        "orders": order_stats["orders"],
+        "revenue": order_stats["revenue"],
+        "products": get_product_stats(db)
+    }
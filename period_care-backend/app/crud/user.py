@@ -1,10 +1,12 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import Optional, List
-from datetime import datetime, date
+from sqlalchemy import and_, func, select, update
+from typing import Optional, List, Iterator, Sequence
+from datetime import datetime, date, time, timedelta
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.config.security import get_password_hash, verify_password
+from app.services.password_hasher import password_hasher
+from app.crud.pagination import Cursor, keyset_page
+from app.crud.principal_cache import principal_cache
 
 
 def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
@@ -15,12 +17,14 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
 
-def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
-    return db.query(User).offset(skip).limit(limit).all()
+def get_users(db: Session, skip: int = 0, limit: int = 100, after: Optional[Cursor] = None) -> List[User]:
+    # Oldest first, matching the original insertion-order listing
+    return keyset_page(db.query(User), User, after, limit, skip, descending=False).all()
 
 
-def create_user(db: Session, user: UserCreate) -> User:
-    hashed_password = get_password_hash(user.password)
+def create_user(db: Session, user: UserCreate, hashed_password: Optional[str] = None) -> User:
+    if hashed_password is None:
+        hashed_password = password_hasher.hash(user.password)
     db_user = User(
         name=user.name,
         email=user.email,
@@ -44,17 +48,33 @@ def update_user(db: Session, user_id: int, user_update: UserUpdate) -> Optional[
         setattr(db_user, field, value)
     
     db.commit()
+    principal_cache.invalidate_user(user_id)
     db.refresh(db_user)
     return db_user
 
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     user = get_user_by_email(db, email)
-    if not user or not verify_password(password, user.password):
+    if not user:
         return None
+    
+    valid, new_hash = password_hasher.verify_and_update(password, user.password)
+    if not valid:
+        return None
+    
+    # The hash was made with a different bcrypt cost: store one at the current cost
+    if new_hash:
+        set_user_password_hash(db, user.id, new_hash)
     return user
 
 
+def set_user_password_hash(db: Session, user_id: int, hashed_password: str) -> None:
+    """Store a new password hash, e.g. one rehashed at the current bcrypt cost"""
+    db.execute(update(User).where(User.id == user_id).values(password=hashed_password))
+    db.commit()
+    principal_cache.invalidate_user(user_id)
+
+
 def update_user_last_order_date(db: Session, user_id: int, order_date: date) -> Optional[User]:
     db_user = get_user_by_id(db, user_id)
     if not db_user:
@@ -63,19 +83,65 @@ def update_user_last_order_date(db: Session, user_id: int, order_date: date) ->
     db_user.last_order_date = order_date
     db_user.reminder_sent = False  # Reset reminder flag when new order is placed
     db.commit()
+    principal_cache.invalidate_user(user_id)
     db.refresh(db_user)
     return db_user
 
 
-def get_users_due_for_reminder(db: Session, target_date: date) -> List[User]:
-    """Get users who last ordered on the target date (30 days ago)"""
-    return db.query(User).filter(
-        and_(
-            User.last_order_date == target_date,
-            User.reminder_sent == False,
-            User.is_active == True
-        )
-    ).all()
+def _due_for_reminder(target_date: date, start_date: Optional[date] = None):
+    """Filter for active, not yet reminded users whose last order fell between
+    start_date and target_date (inclusive; just target_date by default).
+
+    last_order_date is a DateTime, so days are matched as a half-open range;
+    this is an index range scan on ix_users_reminder_due.
+    """
+    range_start = datetime.combine(start_date or target_date, time.min)
+    range_end = datetime.combine(target_date, time.min) + timedelta(days=1)
+    return and_(
+        User.last_order_date >= range_start,
+        User.last_order_date < range_end,
+        User.reminder_sent == False,
+        User.is_active == True
+    )
+
+
+def get_users_due_for_reminder(db: Session, target_date: date, start_date: Optional[date] = None) -> List[User]:
+    """Get users who last ordered on the target date (30 days ago), or since start_date when catching up"""
+    return db.query(User).filter(_due_for_reminder(target_date, start_date)).all()
+
+
+def count_users_due_for_reminder(db: Session, target_date: date, start_date: Optional[date] = None) -> int:
+    return db.query(func.count(User.id)).filter(_due_for_reminder(target_date, start_date)).scalar()
+
+
+def iter_users_due_for_reminder(db: Session, target_date: date, chunk_size: int = 1000,
+                                start_date: Optional[date] = None) -> Iterator[Sequence]:
+    """Stream (id, name, email, mobile, last_order_date) rows of users due for a reminder, chunk by chunk"""
+    result = db.execute(
+        select(User.id, User.name, User.email, User.mobile, User.last_order_date)
+        .where(_due_for_reminder(target_date, start_date))
+        .order_by(User.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    for chunk in result.partitions():
+        yield chunk
+
+
+def mark_users_reminder_sent(db: Session, user_ids: List[int]) -> int:
+    """Set reminder_sent for many users with a single UPDATE"""
+    if not user_ids:
+        return 0
+    
+    result = db.execute(
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(reminder_sent=True)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    for user_id in user_ids:
+        principal_cache.invalidate_user(user_id)
+    return result.rowcount
 
 
 def mark_user_reminder_sent(db: Session, user_id: int) -> Optional[User]:
@@ -85,6 +151,7 @@ def mark_user_reminder_sent(db: Session, user_id: int) -> Optional[User]:
     
     db_user.reminder_sent = True
     db.commit()
+    principal_cache.invalidate_user(user_id)
     db.refresh(db_user)
     return db_user
 
@@ -96,5 +163,6 @@ def toggle_user_status(db: Session, user_id: int) -> Optional[User]:
     
     db_user.is_active = not db_user.is_active
     db.commit()
+    principal_cache.invalidate_user(user_id)
     db.refresh(db_user)
     return db_user
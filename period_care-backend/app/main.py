@@ -1,8 +1,13 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from app.config.database import create_tables
+from app.config.database import create_tables, SessionLocal, dispose_async_engine
 from app.config.firebase import firebase_config
-from app.api.v1 import auth, users, kits, orders, fruits, nutrients, admin, cms, reminders, whatsapp
+from app.api.v1 import auth, users, kits, orders, fruits, nutrients, catalog, admin, cms, reminders, whatsapp
+from app.crud import stats as stats_crud
+from app.tasks.outbox_dispatcher import outbox_dispatcher
+from app.services.smtp_pool import close_smtp_pool
+from app.services.whatsapp_client import close_whatsapp_client
+from app.services.password_hasher import password_hasher
 from app.config.settings import settings
 
 # Create FastAPI application
@@ -33,13 +38,31 @@ async def startup_event():
     else:
         # Initialize SQL database
         create_tables()
+        
+        # Backfill the order analytics rollup on first start
+        db = SessionLocal()
+        try:
+            stats_crud.ensure_daily_order_stats(db)
+        finally:
+            db.close()
         print("�️ SQL database initialized!")
+        
+        if settings.outbox_dispatcher_enabled:
+            outbox_dispatcher.start()
     
     print("�🚀 Period Care API started successfully!")
     print(f"📚 API Documentation: http://localhost:8000/docs")
     print(f"🔧 Environment: {settings.environment}")
     print(f"🗄️ Database Type: {settings.database_type}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    outbox_dispatcher.stop()
+    close_smtp_pool()
+    close_whatsapp_client()
+    password_hasher.close()
+    await dispose_async_engine()
+
 # Health check endpoint
 @app.get("/")
 def read_root():
@@ -57,6 +80,13 @@ def health_check():
         "message": "Period Care API is running smoothly! 💕"
     }
 
+# Async read endpoints are registered first so they take precedence over the
+# sync handlers for the same paths; they share the sync routes' documentation
+if settings.async_database:
+    from app.api.v1 import async_orders, async_users
+    app.include_router(async_users.router, prefix="/api/v1/users", include_in_schema=False)
+    app.include_router(async_orders.router, prefix="/api/v1/orders", include_in_schema=False)
+
 # Include API routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/api/v1/users", tags=["Users"])
@@ -64,6 +94,7 @@ app.include_router(kits.router, prefix="/api/v1/kits", tags=["Kits"])
 app.include_router(orders.router, prefix="/api/v1/orders", tags=["Orders"])
 app.include_router(fruits.router, prefix="/api/v1/fruits", tags=["Fruits"])
 app.include_router(nutrients.router, prefix="/api/v1/nutrients", tags=["Nutrients"])
+app.include_router(catalog.router, prefix="/api/v1/catalog", tags=["Catalog"])
 app.include_router(reminders.router, prefix="/api/v1/reminders", tags=["Reminders"])
 app.include_router(cms.router, prefix="/api/v1/cms", tags=["Content Management"])
 app.include_router(admin.router, prefix="/api/v1/admin", tags=["Admin"])
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Date, UniqueConstraint
+from sqlalchemy.sql import func
+from app.config.database import Base
+
+
+class DailyOrderStats(Base):
+    """Per-day order count and revenue rollup, keyed by date, kit and status"""
+    __tablename__ = "daily_order_stats"
+    __table_args__ = (
+        UniqueConstraint("stat_date", "kit_id", "status", name="uq_daily_order_stats_key"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    stat_date = Column(Date, nullable=False, index=True)
+    kit_id = Column(Integer, ForeignKey("kits.id"), nullable=False)
+    status = Column(String(20), nullable=False)
+    order_count = Column(Integer, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0.0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, DateTime
+from app.config.database import Base
+
+
+class JobLock(Base):
+    """Lease that lets only one scheduler replica run each firing of a job"""
+    __tablename__ = "job_locks"
+    
+    name = Column(String(100), primary_key=True)
+    locked_by = Column(String(255), nullable=False)
+    locked_until = Column(DateTime, nullable=False)
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Index
+from app.config.database import Base
+
+
+class JobRun(Base):
+    """One execution of a scheduled job, kept for duration/error monitoring"""
+    __tablename__ = "job_runs"
+    __table_args__ = (
+        Index("ix_job_runs_job_id_started_at", "job_id", "started_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String(100), nullable=False)
+    host = Column(String(255), nullable=False)
+    started_at = Column(DateTime, nullable=False)
+    duration_ms = Column(Float, nullable=False)
+    status = Column(String(20), nullable=False)  # success, error
+    error = Column(Text, nullable=True)
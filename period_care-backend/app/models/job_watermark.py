@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, DateTime, Date
+from sqlalchemy.sql import func
+from app.config.database import Base
+
+
+class JobWatermark(Base):
+    """Last period a scheduled job completed successfully, so restarts can catch up"""
+    __tablename__ = "job_watermarks"
+    
+    name = Column(String(100), primary_key=True)
+    watermark = Column(Date, nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.config.database import Base
+
+
+class OrderItem(Base):
+    __tablename__ = "order_items"
+    __table_args__ = (
+        Index("ix_order_items_item_type_item_id", "item_type", "item_id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    order_id = Column(Integer, ForeignKey("orders.id"), nullable=False, index=True)
+    item_type = Column(String(20), nullable=False)  # fruit, nutrient
+    item_id = Column(Integer, nullable=False)
+    unit_price_snapshot = Column(Float, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+    
+    # Relationships
+    order = relationship("Order", back_populates="items")
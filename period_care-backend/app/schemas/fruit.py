@@ -14,6 +14,11 @@ class FruitCreate(FruitBase):
     pass
 
 
+class FruitImport(FruitBase):
+    id: Optional[int] = None  # Rows with an id update that fruit instead of adding one
+    is_available: bool = True
+
+
 class FruitUpdate(BaseModel):
     name: Optional[str] = None
     price: Optional[float] = None
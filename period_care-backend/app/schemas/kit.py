@@ -16,6 +16,11 @@ class KitCreate(KitBase):
     pass
 
 
+class KitImport(KitBase):
+    id: Optional[int] = None  # Rows with an id update that kit instead of adding one
+    is_available: bool = True
+
+
 class KitUpdate(BaseModel):
     name: Optional[str] = None
     type: Optional[str] = None
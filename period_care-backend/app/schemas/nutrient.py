@@ -13,6 +13,11 @@ class NutrientCreate(NutrientBase):
     pass
 
 
+class NutrientImport(NutrientBase):
+    id: Optional[int] = None  # Rows with an id update that nutrient instead of adding one
+    is_available: bool = True
+
+
 class NutrientUpdate(BaseModel):
     name: Optional[str] = None
     price: Optional[float] = None
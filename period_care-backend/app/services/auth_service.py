@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from typing import Optional
 from datetime import datetime, timedelta
 from app.crud import user as user_crud
@@ -8,8 +9,12 @@ from app.config.security import (
     create_access_token, 
     create_refresh_token, 
     verify_password,
-    get_password_hash
+    get_password_hash,
+    verify_token
 )
+from app.crud.catalog_cache import detached_copy
+from app.crud.principal_cache import principal_cache
+from app.services.password_hasher import password_hasher
 
 
 class AuthService:
@@ -26,21 +31,7 @@ class AuthService:
         # Create new user
         new_user = user_crud.create_user(self.db, user_data)
         
-        # Generate tokens
-        access_token = create_access_token(data={"sub": new_user.email})
-        refresh_token = create_refresh_token(data={"sub": new_user.email})
-        
-        return AuthResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            token_type="bearer",
-            user={
-                "id": new_user.id,
-                "name": new_user.name,
-                "email": new_user.email,
-                "role": new_user.role
-            }
-        )
+        return self._auth_response(new_user)
     
     def login_user(self, login_data: UserLogin) -> Optional[AuthResponse]:
         """Authenticate and login user"""
@@ -53,7 +44,40 @@ class AuthService:
         if not user or not user.is_active:
             return None
         
-        # Generate tokens
+        return self._auth_response(user)
+    
+    def _find_user_by_email(self, email: str):
+        """Load a user and hand the connection back, so none is held while bcrypt runs"""
+        user = user_crud.get_user_by_email(self.db, email)
+        self.db.close()
+        return user
+    
+    async def register_user_async(self, user_data: UserCreate) -> Optional[AuthResponse]:
+        """Register a new user; database calls use the threadpool, hashing awaits the hasher pool"""
+        existing_user = await run_in_threadpool(self._find_user_by_email, user_data.email)
+        if existing_user:
+            return None
+        
+        hashed_password = await password_hasher.hash_async(user_data.password)
+        new_user = await run_in_threadpool(user_crud.create_user, self.db, user_data, hashed_password)
+        return self._auth_response(new_user)
+    
+    async def login_user_async(self, login_data: UserLogin) -> Optional[AuthResponse]:
+        """Authenticate and login user without holding a thread while the password is checked"""
+        user = await run_in_threadpool(self._find_user_by_email, login_data.email)
+        if not user:
+            return None
+        
+        valid, new_hash = await password_hasher.verify_and_update_async(login_data.password, user.password)
+        if not valid or not user.is_active:
+            return None
+        
+        # The hash was made with a different bcrypt cost: store one at the current cost
+        if new_hash:
+            await run_in_threadpool(user_crud.set_user_password_hash, self.db, user.id, new_hash)
+        return self._auth_response(user)
+    
+    def _auth_response(self, user) -> AuthResponse:
         access_token = create_access_token(data={"sub": user.email})
         refresh_token = create_refresh_token(data={"sub": user.email})
         
@@ -73,6 +97,28 @@ class AuthService:
         """Get current user by email"""
         return user_crud.get_user_by_email(self.db, email)
     
+    def get_user_for_token(self, token: str):
+        """Resolve a bearer token to its user, served from the principal cache when possible"""
+        user_id = principal_cache.get_token_user_id(token)
+        if user_id is not None:
+            user = principal_cache.get_user(user_id)
+            if user is None:
+                user = detached_copy(user_crud.get_user_by_id(self.db, user_id))
+                if user:
+                    principal_cache.set_user(user.id, user)
+            return user
+        
+        payload = verify_token(token)
+        email = payload.get("sub") if payload else None
+        if not email:
+            return None
+        
+        user = detached_copy(user_crud.get_user_by_email(self.db, email))
+        if user:
+            principal_cache.set_token_user_id(token, user.id, payload.get("exp"))
+            principal_cache.set_user(user.id, user)
+        return user
+    
     def refresh_token(self, email: str) -> Optional[AuthResponse]:
         """Generate new access token using refresh token"""
         user = user_crud.get_user_by_email(self.db, email)
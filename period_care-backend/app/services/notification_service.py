@@ -1,8 +1,8 @@
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from app.config.settings import settings
+from app.services.smtp_pool import get_smtp_pool
 
 
 class NotificationService:
@@ -11,30 +11,30 @@ class NotificationService:
         self.smtp_username = settings.smtp_username
         self.smtp_password = settings.smtp_password
     
+    @property
+    def email_configured(self) -> bool:
+        return bool(self.smtp_username and self.smtp_password)
+    
+    def build_message(self, to_email: str, subject: str, body: str, is_html: bool = False) -> MIMEMultipart:
+        """Build a MIME email from the configured sender"""
+        msg = MIMEMultipart()
+        msg['From'] = self.smtp_username
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        
+        msg.attach(MIMEText(body, 'html' if is_html else 'plain'))
+        return msg
+    
     def send_email(self, to_email: str, subject: str, body: str, is_html: bool = False) -> bool:
-        """Send email notification"""
+        """Send email notification over a pooled SMTP session"""
         try:
-            if not self.smtp_username or not self.smtp_password:
+            if not self.email_configured:
                 print(f"📧 Email to {to_email}: {subject}")
                 print(body)
                 print("=" * 50)
                 return True  # Simulate success when no email config
             
-            msg = MIMEMultipart()
-            msg['From'] = self.smtp_username
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(body, 'html' if is_html else 'plain'))
-            
-            server = smtplib.SMTP(self.smtp_server, 587)
-            server.starttls()
-            server.login(self.smtp_username, self.smtp_password)
-            text = msg.as_string()
-            server.sendmail(self.smtp_username, to_email, text)
-            server.quit()
-            
-            return True
+            return get_smtp_pool().send(self.build_message(to_email, subject, body, is_html))
             
         except Exception as e:
             print(f"Failed to send email: {e}")
@@ -87,8 +87,8 @@ The Period Care Team"""
         
         return self.send_email(user_email, subject, body)
     
-    def send_reminder_email(self, user_email: str, user_name: str, last_order_date: str) -> bool:
-        """Send monthly reminder email"""
+    def _format_reminder_email(self, user_name: str, last_order_date: str) -> Tuple[str, str]:
+        """Subject and body of the monthly reminder email"""
         subject = "Time for Your Period Care Reorder 🩷"
         body = f"""Dear {user_name},
 
@@ -110,31 +110,62 @@ Stay prepared, stay confident! 💕
 Best regards,
 The Period Care Team"""
         
+        return subject, body
+    
+    def send_reminder_email(self, user_email: str, user_name: str, last_order_date: str) -> bool:
+        """Send monthly reminder email"""
+        subject, body = self._format_reminder_email(user_name, last_order_date)
         return self.send_email(user_email, subject, body)
     
+    def send_reminder_emails(self, users_data: List[dict]) -> List[bool]:
+        """Send reminder emails in parallel over the SMTP pool; one success flag per user"""
+        if not self.email_configured:
+            return [
+                self.send_reminder_email(user.get('email'), user.get('name'), user.get('last_order_date'))
+                for user in users_data
+            ]
+        
+        messages = []
+        for user in users_data:
+            subject, body = self._format_reminder_email(user.get('name'), user.get('last_order_date'))
+            messages.append(self.build_message(user.get('email'), subject, body))
+        return get_smtp_pool().send_each(messages)
+    
     def send_admin_notification(self, subject: str, message: str) -> bool:
         """Send notification to admin"""
         admin_email = "admin@periodcare.com"  # You can make this configurable
         return self.send_email(admin_email, subject, message)
     
-    def send_bulk_reminders(self, users_data: List[dict]) -> dict:
-        """Send reminder emails to multiple users"""
+    def send_bulk_reminders(self, users_data: List[dict], batch_size: Optional[int] = None) -> dict:
+        """Send reminder emails to multiple users, in parallel batches over the SMTP pool"""
         results = {
             "sent": 0,
             "failed": 0,
-            "total": len(users_data)
+            "total": len(users_data),
+            "batches": []
         }
         
-        for user in users_data:
-            success = self.send_reminder_email(
-                user.get('email'),
-                user.get('name'),
-                user.get('last_order_date')
-            )
+        if not self.email_configured:
+            for user in users_data:
+                if self.send_reminder_email(user.get('email'), user.get('name'), user.get('last_order_date')):
+                    results["sent"] += 1
+                else:
+                    results["failed"] += 1
+            return results
+        
+        batch_size = batch_size or settings.smtp_batch_size
+        pool = get_smtp_pool()
+        for start in range(0, len(users_data), batch_size):
+            messages = []
+            for user in users_data[start:start + batch_size]:
+                subject, body = self._format_reminder_email(user.get('name'), user.get('last_order_date'))
+                messages.append(self.build_message(user.get('email'), subject, body))
             
-            if success:
-                results["sent"] += 1
-            else:
-                results["failed"] += 1
+            batch = pool.send_many(messages)
+            results["sent"] += batch["sent"]
+            results["failed"] += batch["failed"]
+            results["batches"].append(batch)
+            print(f"📧 Reminder batch {len(results['batches'])}: {batch['sent']}/{batch['total']} sent "
+                  f"in {batch['seconds']}s ({batch['per_second']}/s)")
         
         return results
@@ -3,22 +3,56 @@ from typing import Optional, Dict, List
 import json
 from datetime import date
 from app.crud import order as order_crud, kit as kit_crud, fruit as fruit_crud, nutrient as nutrient_crud, user as user_crud
+from app.crud import notification_outbox as outbox_crud
 from app.schemas.order import OrderCreate, OrderCalculation
 from app.models.order import Order
-from app.services.whatsapp_service import WhatsAppService
-from app.services.notification_service import NotificationService
 
 
 class OrderService:
     def __init__(self, db: Session):
         self.db = db
-        self.whatsapp_service = WhatsAppService()
-        self.notification_service = NotificationService()
     
-    def calculate_order_total(self, order_data: OrderCreate) -> Optional[OrderCalculation]:
+    def _parse_item_ids(self, raw_ids: Optional[str]) -> List[int]:
+        """Parse a JSON string of item IDs, skipping anything unusable"""
+        if not raw_ids:
+            return []
+        try:
+            item_ids = json.loads(raw_ids)
+        except json.JSONDecodeError:
+            return []
+        
+        parsed = []
+        for item_id in item_ids if isinstance(item_ids, list) else []:
+            try:
+                parsed.append(int(item_id))
+            except (TypeError, ValueError):
+                continue
+        return parsed
+    
+    def resolve_catalog(self, kit_id: int, selected_fruits: Optional[str], selected_nutrients: Optional[str]) -> Dict:
+        """Load the kit and all selected fruits/nutrients with one query per table"""
+        fruit_ids = self._parse_item_ids(selected_fruits)
+        nutrient_ids = self._parse_item_ids(selected_nutrients)
+        
+        return {
+            "kit": kit_crud.get_kit_by_id(self.db, kit_id),
+            "fruit_ids": fruit_ids,
+            "nutrient_ids": nutrient_ids,
+            "fruits": {fruit.id: fruit for fruit in fruit_crud.get_fruits_by_ids(self.db, fruit_ids)},
+            "nutrients": {nutrient.id: nutrient for nutrient in nutrient_crud.get_nutrients_by_ids(self.db, nutrient_ids)}
+        }
+    
+    def calculate_order_total(self, order_data: OrderCreate, catalog: Optional[Dict] = None) -> Optional[OrderCalculation]:
         """Calculate total order amount"""
+        if catalog is None:
+            catalog = self.resolve_catalog(
+                order_data.kit_id,
+                order_data.selected_fruits,
+                order_data.selected_nutrients
+            )
+        
         # Get kit price
-        kit = kit_crud.get_kit_by_id(self.db, order_data.kit_id)
+        kit = catalog["kit"]
         if not kit or not kit.is_available:
             return None
         
@@ -32,34 +66,24 @@ class OrderService:
         }
         
         # Calculate fruits total
-        if order_data.selected_fruits:
-            try:
-                fruit_ids = json.loads(order_data.selected_fruits)
-                for fruit_id in fruit_ids:
-                    fruit = fruit_crud.get_fruit_by_id(self.db, fruit_id)
-                    if fruit and fruit.is_available:
-                        fruits_total += fruit.price
-                        breakdown["fruits"].append({
-                            "name": fruit.name,
-                            "price": fruit.price
-                        })
-            except json.JSONDecodeError:
-                pass
+        for fruit_id in catalog["fruit_ids"]:
+            fruit = catalog["fruits"].get(fruit_id)
+            if fruit and fruit.is_available:
+                fruits_total += fruit.price
+                breakdown["fruits"].append({
+                    "name": fruit.name,
+                    "price": fruit.price
+                })
         
         # Calculate nutrients total
-        if order_data.selected_nutrients:
-            try:
-                nutrient_ids = json.loads(order_data.selected_nutrients)
-                for nutrient_id in nutrient_ids:
-                    nutrient = nutrient_crud.get_nutrient_by_id(self.db, nutrient_id)
-                    if nutrient and nutrient.is_available:
-                        nutrients_total += nutrient.price
-                        breakdown["nutrients"].append({
-                            "name": nutrient.name,
-                            "price": nutrient.price
-                        })
-            except json.JSONDecodeError:
-                pass
+        for nutrient_id in catalog["nutrient_ids"]:
+            nutrient = catalog["nutrients"].get(nutrient_id)
+            if nutrient and nutrient.is_available:
+                nutrients_total += nutrient.price
+                breakdown["nutrients"].append({
+                    "name": nutrient.name,
+                    "price": nutrient.price
+                })
         
         total_amount = kit_price + fruits_total + nutrients_total
         
@@ -71,10 +95,34 @@ class OrderService:
             breakdown=breakdown
         )
     
+    def _build_order_items(self, catalog: Dict) -> List[Dict]:
+        """Build priced line items for every available selected fruit/nutrient"""
+        items = []
+        for item_type, item_ids, rows in (
+            ("fruit", catalog["fruit_ids"], catalog["fruits"]),
+            ("nutrient", catalog["nutrient_ids"], catalog["nutrients"])
+        ):
+            for item_id in item_ids:
+                item = rows.get(item_id)
+                if item and item.is_available:
+                    items.append({
+                        "item_type": item_type,
+                        "item_id": item.id,
+                        "unit_price_snapshot": item.price
+                    })
+        return items
+    
     def create_order(self, order_data: OrderCreate, user_id: int) -> Optional[Order]:
         """Create a new order"""
+        # Resolve catalog rows once for pricing and the notification
+        catalog = self.resolve_catalog(
+            order_data.kit_id,
+            order_data.selected_fruits,
+            order_data.selected_nutrients
+        )
+        
         # Calculate total
-        calculation = self.calculate_order_total(order_data)
+        calculation = self.calculate_order_total(order_data, catalog)
         if not calculation:
             return None
         
@@ -83,64 +131,57 @@ class OrderService:
             self.db, 
             order_data, 
             user_id, 
-            calculation.total_amount
+            calculation.total_amount,
+            items=self._build_order_items(catalog),
+            commit=False
         )
         
-        if order:
-            # Update user's last order date
-            user_crud.update_user_last_order_date(
-                self.db, 
-                user_id, 
-                order.created_at.date()
-            )
-            
-            # Send WhatsApp notification (async)
-            self._send_order_notification(order.id)
+        # Queue the WhatsApp notification in the same transaction as the order;
+        # the outbox dispatcher sends it outside the request
+        self._enqueue_order_notification(order, catalog)
+        self.db.commit()
+        self.db.refresh(order)
+        
+        # Update user's last order date
+        user_crud.update_user_last_order_date(
+            self.db, 
+            user_id, 
+            order.created_at.date()
+        )
         
         return order
     
-    def _send_order_notification(self, order_id: int):
-        """Send WhatsApp notification for new order"""
-        try:
-            order = order_crud.get_order_with_details(self.db, order_id)
-            if order:
-                message = self._format_order_message(order)
-                success = self.whatsapp_service.send_message(message)
-                
-                if success:
-                    order_crud.mark_whatsapp_sent(self.db, order_id)
-        except Exception as e:
-            print(f"Failed to send WhatsApp notification: {e}")
+    def _enqueue_order_notification(self, order: Order, catalog: Optional[Dict] = None):
+        """Add the admin WhatsApp notification for a new order to the outbox"""
+        outbox_crud.enqueue_notification(
+            self.db,
+            "whatsapp",
+            self._format_order_message(order, catalog),
+            order_id=order.id
+        )
     
-    def _format_order_message(self, order) -> str:
+    def _format_order_message(self, order, catalog: Optional[Dict] = None) -> str:
         """Format order message for WhatsApp"""
-        # Parse fruits and nutrients
-        fruits_list = "None"
-        nutrients_list = "None"
+        if catalog is None:
+            catalog = self.resolve_catalog(
+                order.kit_id,
+                order.selected_fruits,
+                order.selected_nutrients
+            )
         
-        if order.selected_fruits:
-            try:
-                fruit_ids = json.loads(order.selected_fruits)
-                fruits = []
-                for fruit_id in fruit_ids:
-                    fruit = fruit_crud.get_fruit_by_id(self.db, fruit_id)
-                    if fruit:
-                        fruits.append(f"{fruit.emoji_icon} {fruit.name} (₹{fruit.price})")
-                fruits_list = ", ".join(fruits) if fruits else "None"
-            except:
-                pass
-        
-        if order.selected_nutrients:
-            try:
-                nutrient_ids = json.loads(order.selected_nutrients)
-                nutrients = []
-                for nutrient_id in nutrient_ids:
-                    nutrient = nutrient_crud.get_nutrient_by_id(self.db, nutrient_id)
-                    if nutrient:
-                        nutrients.append(f"{nutrient.name} (₹{nutrient.price})")
-                nutrients_list = ", ".join(nutrients) if nutrients else "None"
-            except:
-                pass
+        # Resolve fruits and nutrients
+        fruits = [
+            f"{fruit.emoji_icon} {fruit.name} (₹{fruit.price})"
+            for fruit in (catalog["fruits"].get(fruit_id) for fruit_id in catalog["fruit_ids"])
+            if fruit
+        ]
+        nutrients = [
+            f"{nutrient.name} (₹{nutrient.price})"
+            for nutrient in (catalog["nutrients"].get(nutrient_id) for nutrient_id in catalog["nutrient_ids"])
+            if nutrient
+        ]
+        fruits_list = ", ".join(fruits) if fruits else "None"
+        nutrients_list = ", ".join(nutrients) if nutrients else "None"
         
         message = f"""🩷 New Period Care Order 🩷
 
@@ -0,0 +1,134 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from app.config.security import get_password_hash, verify_password, verify_and_update_password
+from app.config.settings import settings
+
+
+class PasswordHasherBusy(Exception):
+    """Raised by the async methods when max_queue hash calls are already in flight"""
+
+
+class PasswordHasher:
+    """Runs bcrypt in a small process pool instead of on the API's request threads.
+
+    At most ``max_queue`` calls are in flight. Sync callers wait for a slot; the
+    async methods used by the API await the pool without holding a thread and
+    raise ``PasswordHasherBusy`` instead of waiting when every slot is taken.
+    Counters report queue depth and hashing time separately from request latency.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max_queue)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+        self.rejected = 0
+        self.rehashes = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn, not fork: the API process has threads running
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+            return self._executor
+
+    def _started(self) -> float:
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return time.perf_counter()
+
+    def _finished(self, start: float):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.in_flight -= 1
+            self.calls += 1
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def _run(self, fn, *args):
+        with self._slots:
+            start = self._started()
+            try:
+                if self.workers > 0:
+                    return self._get_executor().submit(fn, *args).result()
+                return fn(*args)
+            finally:
+                self._finished(start)
+
+    async def _run_async(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy()
+        try:
+            start = self._started()
+            try:
+                if self.workers > 0:
+                    return await asyncio.wrap_future(self._get_executor().submit(fn, *args))
+                return await run_in_threadpool(fn, *args)
+            finally:
+                self._finished(start)
+        finally:
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        return self._run(get_password_hash, password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._run(verify_password, password, hashed_password)
+
+    def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password; the second value is a new hash when the stored one needs rehashing"""
+        valid, new_hash = self._run(verify_and_update_password, password, hashed_password)
+        if new_hash:
+            with self._lock:
+                self.rehashes += 1
+        return valid, new_hash
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run_async(get_password_hash, password)
+
+    async def verify_and_update_async(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        valid, new_hash = await self._run_async(verify_and_update_password, password, hashed_password)
+        if new_hash:
+            with self._lock:
+                self.rehashes += 1
+        return valid, new_hash
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "bcrypt_rounds": settings.bcrypt_rounds,
+                "in_flight": self.in_flight,
+                "queued": max(self.in_flight - max(self.workers, 1), 0),
+                "peak_in_flight": self.peak_in_flight,
+                "max_queue": self.max_queue,
+                "calls": self.calls,
+                "rejected": self.rejected,
+                "rehashes": self.rehashes,
+                "avg_ms": round(self.total_ms / self.calls, 1) if self.calls else 0.0,
+                "max_ms": round(self.max_ms, 1)
+            }
+
+
+# Global hasher instance
+password_hasher = PasswordHasher(settings.password_hash_workers, settings.password_hash_max_queue)
@@ -1,11 +1,18 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy.orm import Session
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import date, datetime, timedelta
+from app.config.settings import settings
 from app.crud import user as user_crud, reminder as reminder_crud, order as order_crud
+from app.crud import job_watermark as job_watermark_crud
 from app.schemas.reminder import ReminderCreate
 from app.services.whatsapp_service import WhatsAppService
 from app.services.notification_service import NotificationService
 
+# Watermark name for the daily reminder run
+REMINDER_JOB = "daily_reminders"
+
 
 class ReminderService:
     def __init__(self, db: Session):
@@ -13,89 +20,141 @@ class ReminderService:
         self.whatsapp_service = WhatsAppService()
         self.notification_service = NotificationService()
     
+    def get_reminder_window(self, target_date: date) -> Tuple[date, date]:
+        """Range of last-order days to remind: from the day after the last
+        successful run up to target_date"""
+        watermark = job_watermark_crud.get_watermark(self.db, REMINDER_JOB)
+        if not settings.reminder_catch_up or watermark is None or watermark >= target_date:
+            return target_date, target_date
+        
+        return watermark + timedelta(days=1), target_date
+    
+    @staticmethod
+    def split_reminder_window(start_date: date, target_date: date) -> List[Tuple[date, date]]:
+        """Split a catch-up range into batches of at most REMINDER_CATCH_UP_MAX_DAYS days"""
+        step = max(settings.reminder_catch_up_max_days, 1)
+        windows = []
+        while start_date <= target_date:
+            end_date = min(start_date + timedelta(days=step - 1), target_date)
+            windows.append((start_date, end_date))
+            start_date = end_date + timedelta(days=1)
+        return windows
+    
     def check_and_send_reminders(self) -> Dict[str, int]:
-        """Check for users due for reminders and send them"""
-        # Calculate date 30 days ago
+        """Check for users due for reminders and send them, one chunk of users at a time"""
+        # Calculate date 30 days ago, and catch up on days a missed run skipped
         target_date = date.today() - timedelta(days=30)
-        
-        # Get users who ordered exactly 30 days ago and haven't been reminded
-        users_due = user_crud.get_users_due_for_reminder(self.db, target_date)
+        start_date, target_date = self.get_reminder_window(target_date)
         
         results = {
-            "users_found": len(users_due),
+            "users_found": 0,
             "reminders_sent": 0,
             "emails_sent": 0,
             "whatsapp_sent": 0,
-            "admin_notified": 0
+            "admin_notified": 0,
+            "chunks": 0,
+            "failed_chunks": 0,
+            "windows": 0,
+            "start_date": start_date.isoformat(),
+            "target_date": target_date.isoformat()
         }
+        alert_users = []
         
-        reminder_list = []
-        
-        for user in users_due:
-            try:
-                # Create reminder record
-                reminder_data = ReminderCreate(
-                    user_id=user.id,
-                    reminder_type="monthly_reorder",
-                    last_order_date=user.last_order_date
-                )
-                reminder = reminder_crud.create_reminder(self.db, reminder_data)
-                
-                # Send email reminder
-                email_sent = self.notification_service.send_reminder_email(
-                    user.email,
-                    user.name,
-                    user.last_order_date.strftime("%Y-%m-%d")
-                )
-                
-                # Send WhatsApp reminder
-                user_data = {
-                    "name": user.name,
-                    "mobile": user.mobile,
-                    "last_kit_name": "Period Care Kit",  # You might want to get actual kit name
-                    "last_order_date": user.last_order_date.strftime("%Y-%m-%d")
-                }
-                whatsapp_sent = self.whatsapp_service.send_reminder_notification(user_data)
-                
-                # Mark reminder as sent
-                if email_sent or whatsapp_sent:
-                    reminder_crud.mark_reminder_sent(self.db, reminder.id)
-                    user_crud.mark_user_reminder_sent(self.db, user.id)
-                    results["reminders_sent"] += 1
-                
-                if email_sent:
-                    results["emails_sent"] += 1
-                if whatsapp_sent:
-                    results["whatsapp_sent"] += 1
-                
-                # Add to admin notification list
-                reminder_list.append({
-                    "name": user.name,
-                    "email": user.email,
-                    "mobile": user.mobile,
-                    "last_order_date": user.last_order_date.strftime("%Y-%m-%d"),
-                    "last_kit_name": "Period Care Kit"
-                })
-                
-            except Exception as e:
-                print(f"Failed to send reminder to user {user.id}: {e}")
+        # A long outage is worked off in bounded day ranges, oldest first
+        for window_start, window_end in self.split_reminder_window(start_date, target_date):
+            results["windows"] += 1
+            failed_before = results["failed_chunks"]
+            
+            # Stream due users on a separate read session so the per-chunk commits
+            # below don't disturb the open result set
+            with Session(self.db.get_bind()) as read_db:
+                for chunk in user_crud.iter_users_due_for_reminder(
+                    read_db, window_end, settings.reminder_chunk_size, start_date=window_start
+                ):
+                    try:
+                        self._send_reminder_chunk(chunk, results, alert_users)
+                    except Exception as e:
+                        self.db.rollback()
+                        results["failed_chunks"] += 1
+                        print(f"Failed to send reminder chunk starting at user {chunk[0].id}: {e}")
+            
+            # Only advance the watermark past a range whose chunks all went through;
+            # users in a failed chunk are still unreminded and the next run resumes here
+            if results["failed_chunks"] > failed_before:
+                break
+            job_watermark_crud.set_watermark(self.db, REMINDER_JOB, window_end)
         
         # Send admin notification if there are reminders
-        if reminder_list:
-            admin_notified = self.whatsapp_service.send_admin_reminder_alert(reminder_list)
+        if alert_users:
+            admin_notified = self.whatsapp_service.send_admin_reminder_alert(alert_users, results["users_found"])
             if admin_notified:
                 results["admin_notified"] = 1
         
         return results
     
+    def _send_reminder_chunk(self, chunk, results: Dict[str, int], alert_users: List[dict]):
+        """Record, send and mark reminders for one chunk of due users"""
+        results["users_found"] += len(chunk)
+        results["chunks"] += 1
+        
+        # One multi-row INSERT for the chunk's reminder records
+        reminder_ids = reminder_crud.create_reminders(self.db, [
+            {
+                "user_id": user.id,
+                "reminder_type": "monthly_reorder",
+                "last_order_date": user.last_order_date
+            }
+            for user in chunk
+        ])
+        
+        users_data = [
+            {
+                "name": user.name,
+                "email": user.email,
+                "mobile": user.mobile,
+                "last_kit_name": "Period Care Kit",  # You might want to get actual kit name
+                "last_order_date": user.last_order_date.strftime("%Y-%m-%d")
+            }
+            for user in chunk
+        ]
+        
+        # Email and WhatsApp fan out concurrently, each over its own pool
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            emails = executor.submit(self.notification_service.send_reminder_emails, users_data)
+            whatsapp = executor.submit(self.whatsapp_service.send_reminder_notifications, users_data)
+            email_results, whatsapp_results = emails.result(), whatsapp.result()
+        
+        sent_user_ids = [
+            user.id
+            for user, email_sent, whatsapp_sent in zip(chunk, email_results, whatsapp_results)
+            if email_sent or whatsapp_sent
+        ]
+        
+        # Mark the whole chunk with one UPDATE per table
+        reminder_crud.mark_reminders_sent(self.db, [reminder_ids[user_id] for user_id in sent_user_ids])
+        user_crud.mark_users_reminder_sent(self.db, sent_user_ids)
+        
+        results["reminders_sent"] += len(sent_user_ids)
+        results["emails_sent"] += sum(email_results)
+        results["whatsapp_sent"] += sum(whatsapp_results)
+        
+        # Keep the admin alert readable on large reminder days
+        room = settings.reminder_admin_alert_max_users - len(alert_users)
+        alert_users.extend(users_data[:max(room, 0)])
+    
     def get_pending_reminders(self) -> List:
         """Get all pending reminders"""
         return reminder_crud.get_pending_reminders(self.db)
     
     def get_users_due_for_reminder(self) -> List:
-        """Get users who are due for reminders"""
-        target_date = date.today() - timedelta(days=30)
-        return user_crud.get_users_due_for_reminder(self.db, target_date)
+        """Get users who are due for reminders (including any catch-up days)"""
+        start_date, target_date = self.get_reminder_window(date.today() - timedelta(days=30))
+        return user_crud.get_users_due_for_reminder(self.db, target_date, start_date)
+    
+    def count_users_due_for_reminder(self) -> int:
+        """Count users due for reminders without loading them"""
+        start_date, target_date = self.get_reminder_window(date.today() - timedelta(days=30))
+        return user_crud.count_users_due_for_reminder(self.db, target_date, start_date)
     
     def mark_reminder_completed(self, reminder_id: int) -> bool:
         """Mark a reminder as completed"""
@@ -105,7 +164,28 @@ class ReminderService:
     def cleanup_old_reminders(self, days_old: int = 90) -> int:
         """Clean up old completed reminders"""
         cutoff_date = datetime.now() - timedelta(days=days_old)
-        return reminder_crud.delete_old_reminders(self.db, cutoff_date)
+        
+        archive_path = None
+        if settings.reminder_archive_dir:
+            os.makedirs(settings.reminder_archive_dir, exist_ok=True)
+            archive_path = os.path.join(
+                settings.reminder_archive_dir,
+                f"reminders-{datetime.now():%Y%m%d-%H%M%S}.jsonl.gz"
+            )
+        
+        deleted = reminder_crud.delete_old_reminders(
+            self.db,
+            cutoff_date,
+            batch_size=settings.reminder_purge_batch_size,
+            pause_seconds=settings.reminder_purge_pause_seconds,
+            archive_path=archive_path
+        )
+        if archive_path:
+            if deleted:
+                print(f"🗄️ Archived {deleted} reminder records to {archive_path}")
+            else:
+                os.remove(archive_path)
+        return deleted
     
     def send_manual_reminder(self, user_id: int) -> bool:
         """Manually send reminder to a specific user"""
@@ -0,0 +1,155 @@
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from typing import Dict, List, Optional
+from app.config.settings import settings
+
+
+class SMTPSession:
+    """One authenticated SMTP connection, reopened after errors or too many messages"""
+
+    def __init__(self, pool: "SMTPConnectionPool"):
+        self.pool = pool
+        self.server: Optional[smtplib.SMTP] = None
+        self.messages_sent = 0
+
+    def connect(self):
+        self.close()
+        server = smtplib.SMTP(self.pool.host, self.pool.port, timeout=self.pool.timeout)
+        if self.pool.use_tls:
+            server.starttls()
+        # Local debugging servers don't offer AUTH, so only log in when they do
+        if self.pool.username and server.has_extn("auth"):
+            server.login(self.pool.username, self.pool.password)
+        self.server = server
+        self.messages_sent = 0
+        self.pool._record("connections")
+
+    def send(self, msg: Message):
+        if self.server is None or self.messages_sent >= self.pool.max_messages_per_connection:
+            self.connect()
+        try:
+            self.server.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPSenderRefused, OSError):
+            # Stale or dropped connection: reconnect once and retry this message
+            self.pool._record("reconnects")
+            self.connect()
+            self.server.send_message(msg)
+        self.messages_sent += 1
+
+    def close(self):
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.server = None
+
+
+class SMTPConnectionPool:
+    """Small pool of reusable SMTP sessions shared by every email send.
+
+    Sessions are opened lazily, kept authenticated between messages, and used
+    by one thread at a time; ``send_many`` fans a batch out over all of them.
+    """
+
+    def __init__(self, host: str, port: int, username: Optional[str], password: Optional[str],
+                 size: int = 4, use_tls: bool = True, timeout: float = 30,
+                 max_messages_per_connection: int = 100):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.size = size
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.max_messages_per_connection = max_messages_per_connection
+        self._sessions: "queue.Queue[SMTPSession]" = queue.Queue()
+        for _ in range(size):
+            self._sessions.put(SMTPSession(self))
+        self._lock = threading.Lock()
+        self.counters = {"sent": 0, "failed": 0, "connections": 0, "reconnects": 0}
+
+    def _record(self, counter: str):
+        with self._lock:
+            self.counters[counter] += 1
+
+    def send(self, msg: Message) -> bool:
+        """Send one message over a pooled session"""
+        session = self._sessions.get()
+        try:
+            session.send(msg)
+            self._record("sent")
+            return True
+        except Exception as e:
+            session.close()
+            self._record("failed")
+            print(f"Failed to send email to {msg['To']}: {e}")
+            return False
+        finally:
+            self._sessions.put(session)
+
+    def send_each(self, messages: List[Message]) -> List[bool]:
+        """Send messages in parallel across the pool; one success flag per message"""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(self.send, messages))
+
+    def send_many(self, messages: List[Message]) -> Dict:
+        """Send a batch in parallel across the pool and report its throughput"""
+        start = time.perf_counter()
+        results = self.send_each(messages)
+        seconds = time.perf_counter() - start
+
+        sent = sum(results)
+        return {
+            "sent": sent,
+            "failed": len(results) - sent,
+            "total": len(results),
+            "seconds": round(seconds, 3),
+            "per_second": round(len(results) / seconds, 1) if seconds else 0.0
+        }
+
+    def close(self):
+        """Quit every open session"""
+        for _ in range(self.size):
+            session = self._sessions.get()
+            session.close()
+            self._sessions.put(session)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {**self.counters, "size": self.size}
+
+
+_pool: Optional[SMTPConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """Shared SMTP pool built from settings on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SMTPConnectionPool(
+                settings.smtp_server,
+                settings.smtp_port,
+                settings.smtp_username,
+                settings.smtp_password,
+                size=settings.smtp_pool_size,
+                use_tls=settings.smtp_use_tls,
+                timeout=settings.smtp_timeout_seconds,
+                max_messages_per_connection=settings.smtp_max_messages_per_connection
+            )
+        return _pool
+
+
+def close_smtp_pool():
+    """Quit the shared pool's sessions (on shutdown)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+import httpx
+from app.config.settings import settings
+
+
+class WhatsAppClient:
+    """HTTP client for a WhatsApp Business (Cloud API compatible) provider.
+
+    One ``httpx.AsyncClient`` with keep-alive pooling is shared by every send.
+    It lives on a private event loop thread, so both async code and the sync
+    services/workers can use it. A semaphore caps requests in flight, and each
+    recipient number gets at most one message per ``per_number_interval``;
+    numbers idle for longer than that are forgotten.
+    """
+
+    def __init__(self, api_url: str, api_token: Optional[str] = None, max_in_flight: int = 10,
+                 per_number_interval: float = 1.0, timeout: float = 10.0, max_connections: int = 20):
+        self.api_url = api_url
+        self.api_token = api_token
+        self.max_in_flight = max_in_flight
+        self.per_number_interval = per_number_interval
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._number_locks: Dict[str, asyncio.Lock] = {}
+        self._last_sent: Dict[str, float] = {}
+        self._last_pruned = 0.0
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=loop.run_forever, name="whatsapp-client", daemon=True)
+                self._thread.start()
+                asyncio.run_coroutine_threadsafe(self._open(), loop).result()
+                self._loop = loop
+            return self._loop
+
+    async def _open(self):
+        headers = {"Authorization": f"Bearer {self.api_token}"} if self.api_token else {}
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        )
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+
+    @staticmethod
+    def normalize_number(phone_number: str) -> str:
+        """Digits only, with the Indian country code added to bare 10-digit numbers"""
+        digits = "".join(filter(str.isdigit, phone_number))
+        return "91" + digits if len(digits) == 10 else digits
+
+    def _prune_numbers(self):
+        """Forget numbers whose last send is older than the interval and nobody is waiting on"""
+        now = time.monotonic()
+        if now - self._last_pruned < self.per_number_interval:
+            return
+        self._last_pruned = now
+        cutoff = now - self.per_number_interval
+        for number, lock in list(self._number_locks.items()):
+            if not lock.locked() and self._last_sent.get(number, 0.0) <= cutoff:
+                del self._number_locks[number]
+                self._last_sent.pop(number, None)
+
+    async def _wait_for_number(self, number: str):
+        """Space out messages to the same recipient"""
+        self._prune_numbers()
+        lock = self._number_locks.setdefault(number, asyncio.Lock())
+        async with lock:
+            wait = self._last_sent.get(number, 0.0) + self.per_number_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_sent[number] = time.monotonic()
+
+    async def _send(self, phone_number: str, message: str) -> bool:
+        number = self.normalize_number(phone_number)
+        await self._wait_for_number(number)
+        async with self._semaphore:
+            try:
+                response = await self._client.post(self.api_url, json={
+                    "messaging_product": "whatsapp",
+                    "to": number,
+                    "type": "text",
+                    "text": {"body": message}
+                })
+            except httpx.HTTPError as e:
+                print(f"Failed to send WhatsApp message to {number}: {e}")
+                return False
+        if response.is_success:
+            return True
+        print(f"WhatsApp provider rejected message to {number}: {response.status_code} {response.text[:200]}")
+        return False
+
+    async def _send_each(self, messages: List[Tuple[str, str]]) -> List[bool]:
+        return list(await asyncio.gather(*(self._send(number, message) for number, message in messages)))
+
+    async def _send_batch(self, messages: List[Tuple[str, str]]) -> Dict[str, int]:
+        results = await self._send_each(messages)
+        sent = sum(results)
+        return {"sent": sent, "failed": len(results) - sent, "total": len(results)}
+
+    def send_message(self, phone_number: str, message: str) -> bool:
+        """Send one message, blocking the calling thread until the provider answers"""
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._send(phone_number, message), loop).result()
+
+    def send_each(self, messages: List[Tuple[str, str]]) -> List[bool]:
+        """Fan out (phone_number, message) pairs concurrently; one success flag per message"""
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._send_each(messages), loop).result()
+
+    def send_batch(self, messages: List[Tuple[str, str]]) -> Dict[str, int]:
+        """Fan out (phone_number, message) pairs concurrently, blocking until all finish"""
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._send_batch(messages), loop).result()
+
+    def close(self):
+        """Close the HTTP client and stop the loop thread"""
+        with self._start_lock:
+            if self._loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+
+_client: Optional[WhatsAppClient] = None
+_client_lock = threading.Lock()
+
+
+def get_whatsapp_client() -> Optional[WhatsAppClient]:
+    """Shared provider client, or None when no WHATSAPP_API_URL is configured"""
+    global _client
+    if not settings.whatsapp_api_url:
+        return None
+    with _client_lock:
+        if _client is None:
+            _client = WhatsAppClient(
+                settings.whatsapp_api_url,
+                settings.whatsapp_api_token,
+                max_in_flight=settings.whatsapp_max_in_flight,
+                per_number_interval=settings.whatsapp_per_number_interval_seconds,
+                timeout=settings.whatsapp_timeout_seconds,
+                max_connections=settings.whatsapp_max_connections
+            )
+        return _client
+
+
+def close_whatsapp_client():
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -1,43 +1,63 @@
-import httpx
-from typing import Optional
+from typing import Optional, List, Tuple, Dict
 from app.config.settings import settings
+from app.services.whatsapp_client import get_whatsapp_client
 
 
 class WhatsAppService:
     def __init__(self):
         self.admin_number = settings.admin_whatsapp_number
-        # In production, you would use a proper WhatsApp Business API
-        # For now, this is a placeholder implementation
+        # Messages go through the provider client when WHATSAPP_API_URL is set;
+        # otherwise they are printed (development placeholder)
+        self.client = get_whatsapp_client()
+    
+    def _print_message(self, message: str, target_number: str):
+        print(f"📱 WhatsApp Message to {target_number}:")
+        print(message)
+        print("=" * 50)
     
     def send_message(self, message: str, phone_number: Optional[str] = None) -> bool:
         """Send WhatsApp message"""
         try:
             target_number = phone_number or self.admin_number
             
-            # Placeholder implementation
-            # In production, integrate with WhatsApp Business API or service like Twilio
-            print(f"📱 WhatsApp Message to {target_number}:")
-            print(message)
-            print("=" * 50)
-            
-            # You would implement actual WhatsApp API call here
-            # Example using a hypothetical WhatsApp service:
-            # response = httpx.post(
-            #     "https://api.whatsapp.com/send",
-            #     json={
-            #         "phone": target_number,
-            #         "message": message
-            #     },
-            #     headers={"Authorization": f"Bearer {whatsapp_token}"}
-            # )
-            # return response.status_code == 200
+            if self.client is None:
+                self._print_message(message, target_number)
+                return True  # Simulate success
             
-            return True  # Simulate success
+            return self.client.send_message(target_number, message)
             
         except Exception as e:
             print(f"Failed to send WhatsApp message: {e}")
             return False
     
+    def send_messages(self, messages: List[Tuple[Optional[str], str]]) -> Dict[str, int]:
+        """Send (phone_number, message) pairs concurrently; None means the admin number"""
+        messages = [(phone_number or self.admin_number, message) for phone_number, message in messages]
+        if self.client is None:
+            for target_number, message in messages:
+                self._print_message(message, target_number)
+            return {"sent": len(messages), "failed": 0, "total": len(messages)}
+        
+        try:
+            return self.client.send_batch(messages)
+        except Exception as e:
+            print(f"Failed to send WhatsApp messages: {e}")
+            return {"sent": 0, "failed": len(messages), "total": len(messages)}
+    
+    def send_each(self, messages: List[Tuple[Optional[str], str]]) -> List[bool]:
+        """Like send_messages, but with one success flag per message"""
+        messages = [(phone_number or self.admin_number, message) for phone_number, message in messages]
+        if self.client is None:
+            for target_number, message in messages:
+                self._print_message(message, target_number)
+            return [True] * len(messages)
+        
+        try:
+            return self.client.send_each(messages)
+        except Exception as e:
+            print(f"Failed to send WhatsApp messages: {e}")
+            return [False] * len(messages)
+    
     def send_order_notification(self, order_details: dict) -> bool:
         """Send order notification to admin"""
         message = self._format_order_message(order_details)
@@ -48,10 +68,36 @@ class WhatsAppService:
         message = self._format_reminder_message(user_details)
         return self.send_message(message, user_details.get("mobile"))
     
-    def send_admin_reminder_alert(self, users_list: list) -> bool:
-        """Send admin alert about users due for reminders"""
-        message = self._format_admin_reminder_alert(users_list)
-        return self.send_message(message)
+    def send_bulk_reminder_notifications(self, users: List[dict]) -> Dict[str, int]:
+        """Send reminder notifications to many users concurrently"""
+        return self.send_messages([
+            (user.get("mobile"), self._format_reminder_message(user))
+            for user in users
+            if user.get("mobile")
+        ])
+    
+    def send_reminder_notifications(self, users: List[dict]) -> List[bool]:
+        """Send reminder notifications concurrently; one success flag per user (False without a mobile)"""
+        with_mobile = [index for index, user in enumerate(users) if user.get("mobile")]
+        sent = self.send_each([
+            (users[index]["mobile"], self._format_reminder_message(users[index]))
+            for index in with_mobile
+        ])
+        results = [False] * len(users)
+        for index, success in zip(with_mobile, sent):
+            results[index] = success
+        return results
+    
+    def send_admin_reminder_alert(self, users_list: list, total_users: Optional[int] = None) -> bool:
+        """Send admin alert about users due for reminders, split across messages for long lists"""
+        chunk_size = settings.whatsapp_alert_users_per_message
+        chunks = [users_list[i:i + chunk_size] for i in range(0, len(users_list), chunk_size)] or [[]]
+        total_users = total_users if total_users is not None else len(users_list)
+        results = self.send_messages([
+            (None, self._format_admin_reminder_alert(chunk, total_users, index + 1, len(chunks)))
+            for index, chunk in enumerate(chunks)
+        ])
+        return results["failed"] == 0
     
     def _format_order_message(self, order: dict) -> str:
         """Format order notification message"""
@@ -87,7 +133,8 @@ Visit our website: {settings.frontend_url}
 
 Stay comfortable and prepared! 💕"""
     
-    def _format_admin_reminder_alert(self, users: list) -> str:
+    def _format_admin_reminder_alert(self, users: list, total_users: Optional[int] = None,
+                                     part: int = 1, parts: int = 1) -> str:
         """Format admin reminder alert"""
         user_list = []
         for user in users:
@@ -96,12 +143,13 @@ Stay comfortable and prepared! 💕"""
 - Mobile: {user.get('mobile')}
 - Email: {user.get('email')}""")
         
-        return f"""📋 Monthly Reminder Alert 📋
+        part_label = f" ({part}/{parts})" if parts > 1 else ""
+        return f"""📋 Monthly Reminder Alert{part_label} 📋
 
 Users due for reorder reminder:
 
 {chr(10).join(user_list)}
 
-Total users: {len(users)}
+Total users: {total_users if total_users is not None else len(users)}
 
 Consider reaching out for personalized service! 🌟"""
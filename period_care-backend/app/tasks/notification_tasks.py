@@ -62,17 +62,15 @@ def send_bulk_reminder_notifications(users_data: list) -> Dict[str, int]:
         # Send email reminders
         email_results = notification_service.send_bulk_reminders(users_data)
         
-        # Send WhatsApp reminders
-        whatsapp_sent = 0
-        for user in users_data:
-            success = whatsapp_service.send_reminder_notification(user)
-            if success:
-                whatsapp_sent += 1
+        # Send WhatsApp reminders concurrently
+        whatsapp_results = whatsapp_service.send_bulk_reminder_notifications(users_data)
+        whatsapp_sent = whatsapp_results["sent"]
         
         results = {
             "total_users": len(users_data),
             "emails_sent": email_results.get("sent", 0),
             "emails_failed": email_results.get("failed", 0),
+            "email_batches": email_results.get("batches", []),
             "whatsapp_sent": whatsapp_sent,
             "whatsapp_failed": len(users_data) - whatsapp_sent
         }
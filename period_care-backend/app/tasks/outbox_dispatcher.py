@@ -0,0 +1,114 @@
+import random
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from app.config.database import SessionLocal
+from app.config.settings import settings
+from app.crud import notification_outbox as outbox_crud, order as order_crud
+from app.models.notification_outbox import NotificationOutbox
+from app.services.notification_service import NotificationService
+from app.services.whatsapp_service import WhatsAppService
+
+
+class OutboxDispatcher:
+    """Background worker that drains the notification outbox with retries and backoff"""
+
+    def __init__(self):
+        self.whatsapp_service = WhatsAppService()
+        self.notification_service = NotificationService()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def backoff(self, attempts: int) -> timedelta:
+        """Exponential backoff with a little jitter so retries don't line up"""
+        delay = min(
+            settings.outbox_backoff_base_seconds * 2 ** max(attempts - 1, 0),
+            settings.outbox_backoff_max_seconds
+        )
+        return timedelta(seconds=delay * random.uniform(1.0, 1.2))
+
+    def deliver(self, notification: NotificationOutbox) -> bool:
+        if notification.channel == "whatsapp":
+            return self.whatsapp_service.send_message(notification.body, notification.recipient)
+        if notification.channel == "email":
+            if notification.recipient:
+                return self.notification_service.send_email(
+                    notification.recipient,
+                    notification.subject or "",
+                    notification.body
+                )
+            return self.notification_service.send_admin_notification(notification.subject or "", notification.body)
+        raise ValueError(f"Unknown notification channel: {notification.channel}")
+
+    def dispatch_once(self, limit: Optional[int] = None) -> Dict[str, int]:
+        """Send one batch of due notifications"""
+        results = {"sent": 0, "retried": 0, "failed": 0}
+        db = SessionLocal()
+        try:
+            notifications = outbox_crud.claim_due_notifications(
+                db,
+                limit or settings.outbox_batch_size,
+                settings.outbox_lease_seconds
+            )
+            for notification in notifications:
+                try:
+                    delivered = self.deliver(notification)
+                    error = None if delivered else "Provider reported failure"
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+
+                if error is None:
+                    outbox_crud.mark_notification_sent(db, notification)
+                    if notification.channel == "whatsapp" and notification.order_id:
+                        order_crud.mark_whatsapp_sent(db, notification.order_id)
+                    results["sent"] += 1
+                elif notification.attempts + 1 >= settings.outbox_max_attempts:
+                    outbox_crud.mark_notification_failed(db, notification, error, None)
+                    print(f"❌ Gave up on notification {notification.id}: {error}")
+                    results["failed"] += 1
+                else:
+                    retry_at = datetime.utcnow() + self.backoff(notification.attempts + 1)
+                    outbox_crud.mark_notification_failed(db, notification, error, retry_at)
+                    results["retried"] += 1
+        finally:
+            db.close()
+        return results
+
+    def run(self):
+        """Poll the outbox until stop() is called"""
+        while not self._stop.is_set():
+            try:
+                results = self.dispatch_once()
+                # Keep draining without sleeping while there is a backlog
+                if sum(results.values()) > 0:
+                    continue
+            except Exception as e:
+                print(f"❌ Outbox dispatcher error: {e}")
+            self._stop.wait(settings.outbox_poll_interval_seconds)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="outbox-dispatcher", daemon=True)
+        self._thread.start()
+        print("📮 Notification outbox dispatcher started")
+
+    def stop(self, timeout: float = 10.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+# Global dispatcher instance
+outbox_dispatcher = OutboxDispatcher()
+
+
+if __name__ == "__main__":
+    # Run the dispatcher as its own process: python -m app.tasks.outbox_dispatcher
+    print("🚀 Notification outbox dispatcher running, press Ctrl+C to stop")
+    try:
+        outbox_dispatcher.run()
+    except KeyboardInterrupt:
+        print("\n🛑 Notification outbox dispatcher stopped")
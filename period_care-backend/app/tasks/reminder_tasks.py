@@ -1,11 +1,23 @@
-import schedule
+import os
+import socket
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.executors.pool import ThreadPoolExecutor, ProcessPoolExecutor
+from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.orm import Session
-from app.config.database import SessionLocal
+from app.config.database import SessionLocal, engine, create_tables
+from app.crud import job_lock as job_lock_crud, job_run as job_run_crud
 from app.services.reminder_service import ReminderService
 from app.config.settings import settings
 
+# Identifies this scheduler process in job locks and run history
+LOCK_OWNER = f"{socket.gethostname()}:{os.getpid()}"
+
+# A finished job keeps its lock until this long before its next firing
+LOCK_HOLD_MARGIN = timedelta(seconds=30)
+
 
 def get_db_session():
     """Get database session"""
@@ -22,14 +34,18 @@ def daily_reminder_check():
         results = reminder_service.check_and_send_reminders()
         
         print(f"📊 Reminder Check Results:")
+        print(f"   • Last-order window: {results['start_date']} to {results['target_date']}")
         print(f"   • Users found: {results['users_found']}")
         print(f"   • Reminders sent: {results['reminders_sent']}")
         print(f"   • Emails sent: {results['emails_sent']}")
         print(f"   • WhatsApp sent: {results['whatsapp_sent']}")
         print(f"   • Admin notified: {results['admin_notified']}")
+        if results['failed_chunks']:
+            print(f"   • Failed chunks: {results['failed_chunks']} (will be retried on the next run)")
         
     except Exception as e:
         print(f"❌ Error in daily reminder check: {e}")
+        raise
     finally:
         db.close()
 
@@ -46,38 +62,126 @@ def weekly_cleanup():
         
     except Exception as e:
         print(f"❌ Error in weekly cleanup: {e}")
+        raise
+    finally:
+        db.close()
+
+
+# Jobs the scheduler can run, by id. The job store keeps only the id, so
+# jobs survive restarts without pickling functions.
+JOBS = {
+    "daily_reminder_check": daily_reminder_check,
+    "weekly_cleanup": weekly_cleanup,
+}
+
+
+def job_trigger(job_id: str) -> CronTrigger:
+    """When each job fires"""
+    if job_id == "daily_reminder_check":
+        hour, minute = settings.reminder_check_time.split(":")  # Format: "09:00"
+        return CronTrigger(hour=int(hour), minute=int(minute))
+    return CronTrigger(day_of_week="sun", hour=2, minute=0)
+
+
+def lock_hold_until(job_id: str) -> datetime:
+    """Just before the job's next firing, in naive UTC like the lock table.
+    
+    Holding the lock until then stops a replica that wakes late for the same
+    firing (or runs it as a misfire after a restart) from running it again.
+    """
+    next_fire = job_trigger(job_id).get_next_fire_time(None, datetime.now(timezone.utc))
+    return next_fire.astimezone(timezone.utc).replace(tzinfo=None) - LOCK_HOLD_MARGIN
+
+
+def run_job(job_id: str):
+    """Run a job under its cross-replica lock and record how long it took"""
+    db = get_db_session()
+    try:
+        if not job_lock_crud.acquire_job_lock(db, job_id, LOCK_OWNER, settings.scheduler_lock_ttl_seconds):
+            print(f"⏭️ Skipping {job_id}: another scheduler instance is running or already ran this firing")
+            return
+        
+        started_at = datetime.utcnow()
+        start = time.perf_counter()
+        error = None
+        try:
+            JOBS[job_id]()
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            raise
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            job_run_crud.record_job_run(db, job_id, LOCK_OWNER, started_at, duration_ms, error)
+            job_lock_crud.release_job_lock(db, job_id, LOCK_OWNER, hold_until=lock_hold_until(job_id))
+            print(f"⏱️ {job_id} finished in {duration_ms / 1000:.1f}s")
     finally:
         db.close()
 
 
-def schedule_tasks():
-    """Schedule all background tasks"""
-    # Parse reminder check time from settings
-    reminder_time = settings.reminder_check_time  # Format: "09:00"
+def _init_worker_process():
+    """Drop connections inherited from the parent when a pool process starts"""
+    engine.dispose(close=False)
+
+
+def build_scheduler() -> BlockingScheduler:
+    """Scheduler with a persistent job store, thread and process executors"""
+    scheduler = BlockingScheduler(
+        jobstores={
+            "default": SQLAlchemyJobStore(url=settings.scheduler_jobstore_url or settings.database_url)
+        },
+        executors={
+            "default": ThreadPoolExecutor(settings.scheduler_thread_workers),
+            "processpool": ProcessPoolExecutor(
+                settings.scheduler_process_workers,
+                pool_kwargs={"initializer": _init_worker_process}
+            )
+        },
+        job_defaults={
+            # A run missed while the scheduler was down fires once on restart
+            "coalesce": True,
+            "max_instances": 1,
+            "misfire_grace_time": settings.scheduler_misfire_grace_seconds
+        }
+    )
     
     # Schedule daily reminder check
-    schedule.every().day.at(reminder_time).do(daily_reminder_check)
+    scheduler.add_job(
+        run_job,
+        job_trigger("daily_reminder_check"),
+        args=["daily_reminder_check"],
+        id="daily_reminder_check",
+        replace_existing=True
+    )
     
-    # Schedule weekly cleanup (every Sunday at 2 AM)
-    schedule.every().sunday.at("02:00").do(weekly_cleanup)
+    # Schedule weekly cleanup (every Sunday at 2 AM) in its own process, so a
+    # long purge never competes with the reminder run for threads
+    scheduler.add_job(
+        run_job,
+        job_trigger("weekly_cleanup"),
+        args=["weekly_cleanup"],
+        id="weekly_cleanup",
+        executor="processpool",
+        replace_existing=True
+    )
     
     print(f"📅 Scheduled tasks:")
-    print(f"   • Daily reminder check: {reminder_time}")
+    print(f"   • Daily reminder check: {settings.reminder_check_time}")
     print(f"   • Weekly cleanup: Sunday 02:00")
+    return scheduler
 
 
 def run_scheduler():
     """Run the task scheduler"""
-    schedule_tasks()
+    # The scheduler may start before the API has created the lock/run tables
+    create_tables()
+    scheduler = build_scheduler()
     
     print("🚀 Background task scheduler started")
     print("Press Ctrl+C to stop")
     
     try:
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
-    except KeyboardInterrupt:
+        scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
         print("\n🛑 Background task scheduler stopped")
 
 
@@ -12,14 +12,22 @@ from typing import Optional, List, Dict, Any
 import firebase_admin
 from firebase_admin import credentials, firestore
 from dotenv import load_dotenv
+from app.crud.firestore_batch import FirestoreBatchWriter
+from app.crud.firestore_cache import FirestoreCollectionCache
 
 # Load environment variables
 load_dotenv()
 
+# Collections served from in-memory snapshot caches
+CACHED_COLLECTIONS = ('kits', 'benefits', 'testimonials')
+
 class FirebaseService:
     def __init__(self):
         self.db = None
+        self.caches: Dict[str, FirestoreCollectionCache] = {}
         self.initialize_firebase()
+        if os.getenv('FIRESTORE_CACHE', 'true').lower() == 'true':
+            self.start_caches()
     
     def initialize_firebase(self):
         """Initialize Firebase Admin SDK"""
@@ -45,6 +53,31 @@ class FirebaseService:
             print(f"❌ Firebase initialization failed: {str(e)}")
             raise e
     
+    def start_caches(self):
+        """Keep the catalog and CMS collections in memory, refreshed by snapshot listeners"""
+        for collection in CACHED_COLLECTIONS:
+            cache = self.caches.setdefault(collection, FirestoreCollectionCache(self.db, collection))
+            cache.start()
+    
+    def stop_caches(self):
+        """Stop the snapshot listeners"""
+        for cache in self.caches.values():
+            cache.stop()
+    
+    def cache_stats(self) -> List[Dict[str, Any]]:
+        return [cache.stats() for cache in self.caches.values()]
+    
+    def _read_collection(self, collection: str) -> List[Dict[str, Any]]:
+        if collection in self.caches:
+            return self.caches[collection].get_all()
+        
+        documents = []
+        for doc in self.db.collection(collection).stream():
+            data = doc.to_dict()
+            data['id'] = doc.id
+            documents.append(data)
+        return documents
+    
     # User operations
     def create_user(self, user_data: Dict[str, Any]) -> str:
         """Create a new user in Firestore"""
@@ -102,16 +135,7 @@ class FirebaseService:
     def get_all_kits(self) -> List[Dict[str, Any]]:
         """Get all kits from Firestore"""
         try:
-            kits_ref = self.db.collection('kits')
-            docs = kits_ref.stream()
-            
-            kits = []
-            for doc in docs:
-                kit_data = doc.to_dict()
-                kit_data['id'] = doc.id
-                kits.append(kit_data)
-            
-            return kits
+            return self._read_collection('kits')
             
         except Exception as e:
             print(f"Error getting kits: {str(e)}")
@@ -120,6 +144,9 @@ class FirebaseService:
     def get_kit_by_id(self, kit_id: str) -> Optional[Dict[str, Any]]:
         """Get kit by ID"""
         try:
+            if 'kits' in self.caches:
+                return self.caches['kits'].get(kit_id)
+            
             doc_ref = self.db.collection('kits').document(kit_id)
             doc = doc_ref.get()
             
@@ -175,16 +202,7 @@ class FirebaseService:
     def get_all_benefits(self) -> List[Dict[str, Any]]:
         """Get all benefits from Firestore"""
         try:
-            benefits_ref = self.db.collection('benefits')
-            docs = benefits_ref.stream()
-            
-            benefits = []
-            for doc in docs:
-                benefit_data = doc.to_dict()
-                benefit_data['id'] = doc.id
-                benefits.append(benefit_data)
-            
-            return benefits
+            return self._read_collection('benefits')
             
         except Exception as e:
             print(f"Error getting benefits: {str(e)}")
@@ -194,16 +212,7 @@ class FirebaseService:
     def get_all_testimonials(self) -> List[Dict[str, Any]]:
         """Get all testimonials from Firestore"""
         try:
-            testimonials_ref = self.db.collection('testimonials')
-            docs = testimonials_ref.stream()
-            
-            testimonials = []
-            for doc in docs:
-                testimonial_data = doc.to_dict()
-                testimonial_data['id'] = doc.id
-                testimonials.append(testimonial_data)
-            
-            return testimonials
+            return self._read_collection('testimonials')
             
         except Exception as e:
             print(f"Error getting testimonials: {str(e)}")
@@ -218,6 +227,9 @@ class FirebaseService:
                 print("Sample data already exists, skipping initialization")
                 return
             
+            # All sample documents go out in batched commits instead of one RPC each
+            writer = FirestoreBatchWriter(self.db)
+            
             # Sample kits
             sample_kits = [
                 {
@@ -251,7 +263,7 @@ class FirebaseService:
                 kit_id = str(uuid.uuid4())
                 kit['id'] = kit_id
                 kit['created_at'] = datetime.utcnow()
-                self.db.collection('kits').document(kit_id).set(kit)
+                writer.add('kits', kit, kit_id)
             
             # Sample benefits
             sample_benefits = [
@@ -277,7 +289,7 @@ class FirebaseService:
                 benefit_id = str(uuid.uuid4())
                 benefit['id'] = benefit_id
                 benefit['created_at'] = datetime.utcnow()
-                self.db.collection('benefits').document(benefit_id).set(benefit)
+                writer.add('benefits', benefit, benefit_id)
             
             # Sample testimonials
             sample_testimonials = [
@@ -306,8 +318,9 @@ class FirebaseService:
                 testimonial_id = str(uuid.uuid4())
                 testimonial['id'] = testimonial_id
                 testimonial['created_at'] = datetime.utcnow()
-                self.db.collection('testimonials').document(testimonial_id).set(testimonial)
+                writer.add('testimonials', testimonial, testimonial_id)
             
+            writer.flush()
             print("✅ Sample data initialized successfully in Firebase")
             
         except Exception as e:
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Write firestore.indexes.json with the composite indexes the paginated
+Firestore order and user listings need, then deploy them with:
+
+    firebase deploy --only firestore:indexes
+"""
+
+import json
+
+from app.crud.firestore_indexes import index_definitions
+
+INDEXES_FILE = "firestore.indexes.json"
+
+
+if __name__ == "__main__":
+    with open(INDEXES_FILE, "w") as f:
+        json.dump(index_definitions(), f, indent=2)
+        f.write("\n")
+    print(f"✅ Wrote {INDEXES_FILE}")
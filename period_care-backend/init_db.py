@@ -3,6 +3,7 @@
 Database initialization script with sample data for Period Care Backend
 """
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.config.database import SessionLocal, create_tables
 from app.config.security import get_password_hash
@@ -93,9 +94,7 @@ def create_sample_data():
             }
         ]
         
-        for kit_data in kits_data:
-            kit = Kit(**kit_data)
-            db.add(kit)
+        db.execute(insert(Kit), kits_data)
         
         # Create sample fruits
         fruits_data = [
@@ -137,9 +136,7 @@ def create_sample_data():
             }
         ]
         
-        for fruit_data in fruits_data:
-            fruit = Fruit(**fruit_data)
-            db.add(fruit)
+        db.execute(insert(Fruit), fruits_data)
         
         # Create sample nutrients
         nutrients_data = [
@@ -170,9 +167,7 @@ def create_sample_data():
             }
         ]
         
-        for nutrient_data in nutrients_data:
-            nutrient = Nutrient(**nutrient_data)
-            db.add(nutrient)
+        db.execute(insert(Nutrient), nutrients_data)
         
         # Create sample benefits
         benefits_data = [
@@ -4,6 +4,7 @@ Firebase initialization script with sample data for Period Care Backend
 """
 
 from app.config.firebase import get_firestore_db
+from app.crud.firestore_batch import FirestoreBatchWriter
 from app.config.security import get_password_hash
 from datetime import datetime
 import json
@@ -20,6 +21,9 @@ def create_firebase_sample_data():
     try:
         print("📝 Creating sample data in Firebase Firestore...")
         
+        # All sample documents go out in batched commits instead of one RPC each
+        writer = FirestoreBatchWriter(db)
+        
         # Create admin user
         admin_data = {
             "name": "Admin User",
@@ -34,7 +38,7 @@ def create_firebase_sample_data():
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow()
         }
-        db.collection('users').add(admin_data)
+        writer.add('users', admin_data)
         
         # Create test user
         test_user_data = {
@@ -50,7 +54,7 @@ def create_firebase_sample_data():
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow()
         }
-        db.collection('users').add(test_user_data)
+        writer.add('users', test_user_data)
         print("✅ Users created")
         
         # Create sample kits
@@ -107,7 +111,7 @@ def create_firebase_sample_data():
         ]
         
         for kit_data in kits_data:
-            db.collection('kits').add(kit_data)
+            writer.add('kits', kit_data)
         print("✅ Kits created")
         
         # Create sample fruits
@@ -151,7 +155,7 @@ def create_firebase_sample_data():
         ]
         
         for fruit_data in fruits_data:
-            db.collection('fruits').add(fruit_data)
+            writer.add('fruits', fruit_data)
         print("✅ Fruits created")
         
         # Create sample nutrients
@@ -183,7 +187,7 @@ def create_firebase_sample_data():
         ]
         
         for nutrient_data in nutrients_data:
-            db.collection('nutrients').add(nutrient_data)
+            writer.add('nutrients', nutrient_data)
         print("✅ Nutrients created")
         
         # Create sample benefits
@@ -209,7 +213,7 @@ def create_firebase_sample_data():
         ]
         
         for benefit_data in benefits_data:
-            db.collection('benefits').add(benefit_data)
+            writer.add('benefits', benefit_data)
         print("✅ Benefits created")
         
         # Create sample testimonials
@@ -237,9 +241,11 @@ def create_firebase_sample_data():
         ]
         
         for testimonial_data in testimonials_data:
-            db.collection('testimonials').add(testimonial_data)
+            writer.add('testimonials', testimonial_data)
         print("✅ Testimonials created")
         
+        writer.flush()
+        print(f"💾 Wrote {writer.writes} documents in {writer.commits} batch commit(s)")
         print("🎉 Firebase sample data created successfully!")
         print("🔑 Admin Login: admin@periodcare.com / admin123")
         print("👤 Test User: priya@example.com / user123")
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Rebuild the daily order/revenue rollup used by the admin analytics endpoints
+"""
+
+from app.config.database import SessionLocal, create_tables
+from app.crud import stats as stats_crud
+import app.main  # noqa: F401  (registers all models)
+
+
+def rebuild_daily_order_stats():
+    """Recompute daily_order_stats from the orders table"""
+    db = SessionLocal()
+    
+    try:
+        print("📊 Rebuilding daily order statistics...")
+        rows = stats_crud.rebuild_daily_order_stats(db)
+        print(f"✅ Rollup rebuilt with {rows} rows")
+        
+    except Exception as e:
+        print(f"❌ Error rebuilding statistics: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    create_tables()
+    rebuild_daily_order_stats()
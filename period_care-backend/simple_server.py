@@ -20,6 +20,8 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+from app.services.whatsapp_client import get_whatsapp_client
+
 # Check database type from environment
 DATABASE_TYPE = os.getenv('DATABASE_TYPE', 'sqlite').lower()
 
@@ -222,8 +224,13 @@ def get_db_connection():
     return conn
 
 def send_whatsapp_message(phone_number: str, message: str) -> bool:
-    """Send WhatsApp message notification - directly opens WhatsApp to send message"""
+    """Send WhatsApp message notification - through the provider API when
+    WHATSAPP_API_URL is set, otherwise by opening WhatsApp Web (desktop only)"""
     try:
+        whatsapp_client = get_whatsapp_client()
+        if whatsapp_client is not None:
+            return whatsapp_client.send_message(phone_number, message)
+        
         # Clean the phone number (remove any non-digits)
         clean_phone = ''.join(filter(str.isdigit, phone_number))
         
@@ -386,6 +393,22 @@ def db_get_all_testimonials():
 def read_root():
     return {"message": "Period Care API Server is running!"}
 
+@app.get("/api/cache/stats")
+def get_cache_stats():
+    """Firestore collection cache hits, misses and listener state"""
+    if DATABASE_TYPE != 'firebase':
+        return []
+    return get_firebase_service().cache_stats()
+
+@app.on_event("shutdown")
+def stop_firestore_listeners():
+    """Stop the Firestore snapshot listeners"""
+    if DATABASE_TYPE == 'firebase':
+        try:
+            get_firebase_service().stop_caches()
+        except Exception as e:
+            print(f"❌ Failed to stop Firestore listeners: {e}")
+
 @app.get("/api/kits")
 def get_kits():
     """Get all available kits"""